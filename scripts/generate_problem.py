@@ -8,12 +8,15 @@ Usage:
 """
 
 import argparse
+from dataclasses import replace
+from functools import lru_cache
+from itertools import islice
 from src.business_objects.config import InstanceGenConfig
 from src.business_objects.generators import make_objects, save_json_files
 
-# Predefined scenarios
-SCENARIOS = {
-    "small": InstanceGenConfig(
+# Predefined scenarios (plain kwargs; configs are built on demand by get_scenario)
+_SCENARIO_SPECS = {
+    "small": dict(
         seed=42,
         items=dict(num_items=10, cold_ratio=0.4, weight_kg=(0.5, 9.0), volume_m3=(0.001, 0.02)),
         customers=dict(num_customers=5, vip_fraction=0.2),
@@ -21,7 +24,7 @@ SCENARIOS = {
         trucks=dict(num_trucks_cold=1, num_trucks_dry=2),
         depots=dict(num_depots=1, availability="all"),
     ),
-    "medium": InstanceGenConfig(
+    "medium": dict(
         seed=123,
         items=dict(num_items=20, cold_ratio=0.45, weight_kg=(0.5, 9.0), volume_m3=(0.001, 0.02)),
         customers=dict(num_customers=10, vip_fraction=0.30),
@@ -29,7 +32,7 @@ SCENARIOS = {
         trucks=dict(num_trucks_cold=2, num_trucks_dry=3),
         depots=dict(num_depots=1, availability=("sample", 4)),
     ),
-    "large": InstanceGenConfig(
+    "large": dict(
         seed=999,
         items=dict(num_items=50, cold_ratio=0.5, weight_kg=(0.5, 9.0), volume_m3=(0.001, 0.02)),
         customers=dict(num_customers=30, vip_fraction=0.25),
@@ -40,10 +43,21 @@ SCENARIOS = {
 }
 
 
+@lru_cache(maxsize=None)
+def get_scenario(name: str) -> InstanceGenConfig:
+    """
+    Build (once) the InstanceGenConfig for a predefined scenario.
+    The result is shared between callers: derive variants with dataclasses.replace.
+    """
+    if name not in _SCENARIO_SPECS:
+        raise KeyError(f"Unknown scenario '{name}'. Available: {sorted(_SCENARIO_SPECS)}")
+    return InstanceGenConfig(**_SCENARIO_SPECS[name])
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate grocery delivery example")
     parser.add_argument("--output", default="../problems/problem_1", help="Output directory name")
-    parser.add_argument("--scenario", choices=["small", "medium", "large"], default="medium", help="Use predefined scenario")
+    parser.add_argument("--scenario", choices=list(_SCENARIO_SPECS), default="medium", help="Use predefined scenario")
     parser.add_argument("--seed", type=int, help="Random seed")
     parser.add_argument("--orders", type=int, help="Override number of orders")
     parser.add_argument("--customers", type=int, help="Override number of customers")
@@ -52,19 +66,19 @@ def main():
 
     # Load configuration
     if args.scenario:
-        cfg = SCENARIOS[args.scenario]
+        cfg = get_scenario(args.scenario)
         print(f"Using '{args.scenario}' scenario")
     else:
         # Default configuration
-        cfg = SCENARIOS["medium"]
+        cfg = get_scenario("medium")
 
-    # Apply overrides
+    # Apply overrides (on copies: the cached scenario config stays untouched)
     if args.seed:
-        cfg.seed = args.seed
+        cfg = replace(cfg, seed=args.seed)
     if args.orders:
-        cfg.orders["num_orders"] = args.orders
+        cfg = replace(cfg, orders=replace(cfg.orders, num_orders=args.orders))
     if args.customers:
-        cfg.customers["num_customers"] = args.customers
+        cfg = replace(cfg, customers=replace(cfg.customers, num_customers=args.customers))
 
     # Generate objects
     print(f"\nGenerating with seed={cfg.seed}...")
@@ -75,7 +89,7 @@ def main():
 
     # Show preview
     print("Sample Customers:")
-    for cid, c in list(objs["customers"].items())[:3]:
+    for cid, c in islice(objs["customers"].items(), 3):
         print(f"  {cid}: {c.name}, VIP={c.vip}")
 
     print("\nSample Order:")
@@ -4,20 +4,6 @@ import json
 from pathlib import Path
 from datetime import datetime
 
-from src.business_objects.customer_order import CustomerOrder
-from src.heuristics.selectors.order_selector_vip_due import OrderLevelSelector
-from src.heuristics.selectors.item_selector_priority import ItemLevelSorter
-from src.heuristics.placers.packing import SimplePackingPolicy
-from src.heuristics.placers.feasibility import SimpleFeasibility
-from src.heuristics.placers.policy import SimplePolicy
-from src.heuristics.placers.state_view import SimpleStateView
-from src.planning.selection_orchestrator import SelectionOrchestrator
-from src.planning.placer_orchestrator import PlacerOrchestrator
-from src.quality_metrics.tracker import DayTracker
-from src.business_objects.customer_order import load_orders_from_json_list
-from src.heuristics.selectors.select_state import SelectionState
-from scripts.utils import load_instance, build_sorted_items_map_from_logs
-
 # ============================================================================
 # CONFIGURATION
 # ============================================================================
@@ -27,6 +13,9 @@ INPUT_DIR = "../problems/problem_1"
 OUTPUT_DIR = Path("../reports")
 SELECTION_OUTPUT = OUTPUT_DIR / "selection"
 PLACEMENT_OUTPUT = OUTPUT_DIR / "placement"
+# Reuse the built instance across runs (pickled under <repo>/.cache/instances;
+# rebuilt whenever the JSON inputs or the loader code change)
+USE_INSTANCE_CACHE = False
 """
 # Phase 1: Selection Schemes
 ORDER_SCHEME = ("vip", "due", "alpha", "v_eff")
@@ -88,8 +77,21 @@ DRY_SCHEME_C=(
 # ============================================================================
 
 def main():
+    # Imported here so module import (e.g. for its constants) stays cheap.
+    from src.heuristics.selectors.order_selector_vip_due import OrderLevelSelector
+    from src.heuristics.selectors.item_selector_priority import ItemLevelSorter
+    from src.heuristics.placers.packing import SimplePackingPolicy
+    from src.heuristics.placers.feasibility import SimpleFeasibility
+    from src.heuristics.placers.policy import SimplePolicy
+    from src.heuristics.placers.state_view import SimpleStateView
+    from src.planning.selection_orchestrator import SelectionOrchestrator
+    from src.planning.placer_orchestrator import PlacerOrchestrator
+    from src.quality_metrics.tracker import DayTracker
+    from src.heuristics.selectors.select_state import SelectionState
+    from scripts.utils import load_instance, build_sorted_items_map_from_logs
+
     # Load instance
-    depot, orders, customers, items = load_instance(INPUT_DIR)
+    depot, orders, customers, items = load_instance(INPUT_DIR, use_cache=USE_INSTANCE_CACHE)
 
     # Bind due_dt for selectors
     today0 = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
@@ -1,7 +1,12 @@
 """Utility functions for loading instances and reconstructing data."""
 
 from typing import Dict, List
+import hashlib
 import json
+import pickle
+import sys
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from src.business_objects.customer_order import load_orders_from_json_list, CustomerOrder
 from src.business_objects.customer import Customer
@@ -9,7 +14,30 @@ from src.business_objects.common import TruckType
 from src.business_objects.truck import Truck
 from src.business_objects.depot import Depot
 from src.business_objects.item import Item
-from src.heuristics.selectors.item_selector_priority import ItemRank
+from src.heuristics.selectors.item_selector_priority import ItemFeatures, ItemRank
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+
+# Instance files that feed load_instance; their bytes key the optional pickle cache.
+_CATALOG_FILES = ("depots.json", "trucks.json", "items.json", "customers.json")
+_INSTANCE_FILES = _CATALOG_FILES + ("orders.json",)
+# Opt-in instance cache lives outside the input directories (git-ignored).
+_DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "instances"
+
+# "Reefer"/"reefer"/"REEFER" (and Dry) → TruckType, without a per-truck .upper().
+_TRUCK_TYPES = {key: tt for tt in TruckType for key in (tt.value, tt.value.lower(), tt.name)}
+
+
+def _read_json(path: Path):
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
 
 
 def build_sorted_items_map_from_logs(tracker) -> Dict[str, List[ItemRank]]:
@@ -20,40 +48,45 @@ def build_sorted_items_map_from_logs(tracker) -> Dict[str, List[ItemRank]]:
     out: Dict[str, List[ItemRank]] = {}
     # tracker.selection_logs() returns {"orders": [...], "items": [...]}
     item_rows = tracker.selection_logs().get("items", [])
-    # rows already include "order_id" and a "rank" column
-    # group then sort and rebuild ItemRank objects
-    by_order: Dict[str, List[dict]] = {}
-    for row in item_rows:
-        by_order.setdefault(row["order_id"], []).append(row)
-
-    for oid, rows in by_order.items():
-        rows.sort(key=lambda r: int(r["rank"]))
-        rebuilt: List[ItemRank] = []
-        for r in rows:
-            rebuilt.append(
-                ItemRank(
-                    item_id=str(r["item_id"]),
-                    qty=int(r["qty"]),
-                    features={
-                        "cold01": float(r["cold01"]),
-                        "w_ij": float(r["w_ij"]),
-                        "v_ij_eff": float(r["v_ij_eff"]),
-                        "liquid01": float(r["liquid01"]),
-                        "stack_limit": float(r["stack_limit"]),
-                        "fragile_score": float(r["fragile_score"]),
-                        "upright01": float(r["upright01"]),
-                        "sep_tag": str(r["sep_tag"])
-                    },
-                )
+    # rows already include "order_id" and a "rank" column:
+    # one sort by (order_id, rank), then slice contiguous groups
+    item_rows = sorted(item_rows, key=lambda r: (r["order_id"], int(r["rank"])))
+    for oid, rows in groupby(item_rows, key=itemgetter("order_id")):
+        out[oid] = [
+            ItemRank(
+                item_id=str(r["item_id"]),
+                qty=int(r["qty"]),
+                features=ItemFeatures(
+                    cold01=float(r["cold01"]),
+                    w_ij=float(r["w_ij"]),
+                    v_ij_eff=float(r["v_ij_eff"]),
+                    liquid01=float(r["liquid01"]),
+                    stack_limit=float(r["stack_limit"]),
+                    fragile_score=float(r["fragile_score"]),
+                    upright01=float(r["upright01"]),
+                    sep_tag=sys.intern(str(r["sep_tag"]).lower()),
+                ),
             )
-        out[oid] = rebuilt
+            for r in rows
+        ]
     return out
 
 
-def load_instance(base_dir: str = "../problems/problem_1"):
+def load_instance(
+        base_dir: str = "../problems/problem_1",
+        *,
+        use_cache: bool = False,
+        cache_dir: str | Path | None = None,
+):
     """
     Load depot, trucks, customers, items, and orders from generated JSONs.
 
+    With use_cache=True the built objects are pickled into `cache_dir`
+    (default: <repo>/.cache/instances), never into `base_dir`. The cache key
+    covers the JSON files' content and the source of the modules that build the
+    objects, so editing either invalidates it. Only enable it for cache
+    directories you control: entries are loaded with pickle.
+
     Returns:
         depot: Depot
         orders: dict[str, CustomerOrder]
@@ -64,20 +97,71 @@ def load_instance(base_dir: str = "../problems/problem_1"):
     if not base.exists():
         raise FileNotFoundError(f"{base} not found")
 
+    if not use_cache:
+        return _build_instance(base)
+
+    cache_root = Path(cache_dir) if cache_dir is not None else _DEFAULT_CACHE_DIR
+    # one entry per input directory: <dir hash>-<content+code hash>.pkl
+    prefix = hashlib.md5(str(base.resolve()).encode()).hexdigest()[:16]
+    cache_path = cache_root / f"{prefix}-{_instance_digest(base)}.pkl"
+    if cache_path.exists():
+        try:
+            return pickle.loads(cache_path.read_bytes())
+        except Exception:
+            pass  # unreadable/stale entry: rebuild below
+
+    instance = _build_instance(base)
+    try:
+        cache_root.mkdir(parents=True, exist_ok=True)
+        for stale in cache_root.glob(f"{prefix}-*.pkl"):
+            stale.unlink(missing_ok=True)
+        cache_path.write_bytes(pickle.dumps(instance, protocol=5))
+    except OSError:
+        pass  # unwritable cache dir: just skip caching
+    return instance
+
+
+def _builder_sources() -> List[Path]:
+    """Source files whose code shapes the cached objects (this module + business objects)."""
+    modules = {__name__, Depot.__module__, Truck.__module__, Item.__module__,
+               Customer.__module__, CustomerOrder.__module__, TruckType.__module__}
+    return sorted(Path(sys.modules[m].__file__) for m in modules)
+
+
+def _instance_digest(base: Path) -> str:
+    h = hashlib.md5()
+    for src in _builder_sources():
+        h.update(src.read_bytes())
+    for name in _INSTANCE_FILES:
+        path = base / name
+        if path.exists():
+            h.update(name.encode())
+            h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def _build_instance(base: Path):
+    # customers.json is optional
+    raw = {
+        n: _read_json(base / n)
+        for n in _CATALOG_FILES
+        if n != "customers.json" or (base / n).exists()
+    }
+
     # === Depots ===
-    depots_data = json.load((base / "depots.json").open())
+    depots_data = raw["depots.json"]
     depot_entry = depots_data[0]  # assuming one depot
     depot_id = depot_entry["depot_id"]
     depot_location = depot_entry.get("location", "unknown")
     depot_available_trucks =depot_entry["available_trucks"]
 
     # === Trucks ===
-    trucks_data = json.load((base / "trucks.json").open())
+    trucks_data = raw["trucks.json"]
     trucks = {}
     for t in trucks_data:
         trucks[t["truck_id"]] = Truck(
             truck_id=t["truck_id"],
-            type=TruckType[t["type"].upper()],           # "Reefer"/"Dry" → enum
+            type=_TRUCK_TYPES.get(t["type"]) or TruckType[t["type"].upper()],  # "Reefer"/"Dry" → enum
             total_capacity_m3=t["total_capacity_m3"],
             cold_capacity_m3=t.get("cold_capacity_m3", 0.0),
             weight_limit_kg=t["weight_limit_kg"],
@@ -88,9 +172,9 @@ def load_instance(base_dir: str = "../problems/problem_1"):
 
         )
     available_trucks_for_depot = {
-        truck_id: trucks[truck_id]
+        truck_id: truck
         for truck_id in depot_available_trucks
-        if truck_id in trucks
+        if (truck := trucks.get(truck_id)) is not None
     }
 
     depot = Depot(
@@ -100,15 +184,13 @@ def load_instance(base_dir: str = "../problems/problem_1"):
     )
 
     # === Items ===
-    items_data = json.load((base / "items.json").open())
-    items = {i["item_id"]: Item(**i) for i in items_data}
+    items_data = raw["items.json"]
+    items = {sys.intern(i["item_id"]): Item(**i) for i in items_data}
 
     # === Customers ===
-    customers_path = base / "customers.json"
     customers: dict[str, Customer] = {}
-    if customers_path.exists():
-        customers_data = json.load(customers_path.open())
-        for c in customers_data:
+    if "customers.json" in raw:
+        for c in raw["customers.json"]:
             customers[c["customer_id"]] = Customer(
                 customer_id=c["customer_id"],
                 name=c.get("name", ""),
@@ -118,7 +200,6 @@ def load_instance(base_dir: str = "../problems/problem_1"):
             )
 
     # === Orders ===
-    orders_data = json.load((base / "orders.json").open())
-    orders: dict[str, CustomerOrder] = load_orders_from_json_list(orders_data, items)
+    orders: dict[str, CustomerOrder] = load_orders_from_json_list(_read_json(base / "orders.json"), items)
 
     return depot, orders, customers, items
\ No newline at end of file
@@ -29,7 +29,7 @@ class SeparationTag(str, Enum):
     HAZARDOUS = "Hazardous"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dimensions:
     """
     Physical dimensions in meters (length × width × height).
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import hashlib
+import random
+import re
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import List, Optional, Tuple, Union
 
 from .common import TruckType
@@ -11,11 +13,27 @@ from .common import TruckType
 # Helper: time validation
 # -------------------------
 
+# Zero-padded 24h 'HH:MM'; groups are (hour, minute).
+_HHMM_RE = re.compile(r"\A([01]\d|2[0-3]):([0-5]\d)\Z")
+
+
 def _validate_hhmm(s: str, *, field_name: str) -> None:
-    try:
-        datetime.strptime(s, "%H:%M")
-    except ValueError as e:
-        raise ValueError(f"{field_name} must be 'HH:MM' (24h). Got '{s}'.") from e
+    if not _HHMM_RE.match(s):
+        raise ValueError(f"{field_name} must be 'HH:MM' (24h). Got '{s}'.")
+
+
+# -------------------------
+# Helper: per-subsystem seeding
+# -------------------------
+
+def sub_rng(seed: int, name: str) -> random.Random:
+    """
+    Independent RNG stream for one generation subsystem ("items", "orders", ...).
+    The sub-seed is derived from MD5("<seed>:<name>"), so changing how many draws
+    one subsystem makes never shifts the output of another.
+    """
+    digest = hashlib.md5(f"{seed}:{name}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
 
 
 # -------------------------
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from typing import Dict, Optional, Mapping
 from .item import Item
 
 
+# Required id fields of an order JSON record, fetched in one C-level call.
+_ID_FIELDS = itemgetter("order_id", "customer_id")
 
-@dataclass
+
+@dataclass(slots=True)
 class CustomerOrder:
     """
     A daily order placed by a customer.
@@ -46,6 +51,10 @@ class CustomerOrder:
     # Runtime
     due_dt: Optional[datetime] = field(default=None, repr=False, compare=False)
 
+    # Per-line type checks in __post_init__. Bulk builders with trusted inputs
+    # (the generators) pass validate=False; `python -O` skips them too.
+    validate: InitVar[bool] = True
+
     # ------------------------------------------------------------------ #
     # Time utilities
     # ------------------------------------------------------------------ #
@@ -75,13 +84,13 @@ class CustomerOrder:
         for pid, qty in self.item_list.items():
             if qty <= 0:
                 continue
-            if pid not in items:
+            prod = items.get(pid)
+            if prod is None:
                 raise KeyError(f"Item '{pid}' not found in catalog for order '{self.order_id}'.")
 
-            prod = items[pid]
             unit_vol = float(prod.unit_volume_m3)
             unit_wt = float(prod.unit_weight_kg)
-            unit_v_eff = float(prod.effective_unit_volume()) if hasattr(prod, "effective_unit_volume") else unit_vol
+            unit_v_eff = prod.effective_unit_volume()
 
             q_ij = qty * unit_vol
             w_ij = qty * unit_wt
@@ -108,13 +117,13 @@ class CustomerOrder:
     # ------------------------------------------------------------------ #
 
     def totals_dict(self) -> Dict[str, float]:
-        """Return computed aggregates for logging or CSV export."""
+        """Return computed aggregates for logging or CSV export (already floats)."""
         return {
-            "q_i_total_volume_m3": float(self.total_volume_m3),
-            "q_i_cold_volume_m3": float(self.cold_volume_m3),
-            "w_i_weight_kg": float(self.weight_kg),
-            "v_i_eff_volume_m3": float(self.effective_volume_m3),
-            "alpha_i_cold_fraction": float(self.cold_fraction),
+            "q_i_total_volume_m3": self.total_volume_m3,
+            "q_i_cold_volume_m3": self.cold_volume_m3,
+            "w_i_weight_kg": self.weight_kg,
+            "v_i_eff_volume_m3": self.effective_volume_m3,
+            "alpha_i_cold_fraction": self.cold_fraction,
         }
 
     @classmethod
@@ -163,8 +172,8 @@ class CustomerOrder:
             vᵢᵉᶠᶠ     = effective (padded) volume (m³)
             αᵢ        = cold fraction = qᵢᶜᵒˡᵈ / qᵢ
         """
-        oid = str(data["order_id"])
-        cid = str(data["customer_id"])
+        oid, cid = _ID_FIELDS(data)
+        oid, cid = str(oid), str(cid)
 
         # Accept either "item_list" or "items" in JSON
         raw_items = data.get("item_list") or data.get("items")
@@ -172,9 +181,8 @@ class CustomerOrder:
             raise TypeError("orders JSON must include 'item_list' (or 'items') as a dict of item_id -> qty")
 
         # Coerce all quantities to int and ids to str
-        ilist: Dict[str, int] = {}
-        for k, v in raw_items.items():
-            ilist[str(k)] = int(v)
+        # ids interned: they are looked up in the item catalog for every aggregation
+        ilist: Dict[str, int] = {sys.intern(str(k)): int(v) for k, v in raw_items.items()}
 
         due = str(data.get("due_time_str") or data.get("due") or "23:59")
 
@@ -204,14 +212,15 @@ class CustomerOrder:
     # Validation
     # ------------------------------------------------------------------ #
 
-    def __post_init__(self) -> None:
+    def __post_init__(self, validate: bool) -> None:
         if not isinstance(self.item_list, dict):
             raise TypeError("item_list must be a dict mapping item_id -> quantity.")
-        for pid, qty in self.item_list.items():
-            if not isinstance(pid, str):
-                raise TypeError("item_list keys must be item_id strings.")
-            if not isinstance(qty, int):
-                raise TypeError("item_list values must be integer quantities.")
+        if __debug__ and validate:
+            for pid, qty in self.item_list.items():
+                if not isinstance(pid, str):
+                    raise TypeError("item_list keys must be item_id strings.")
+                if not isinstance(qty, int):
+                    raise TypeError("item_list values must be integer quantities.")
 
 
 def load_orders_from_json_list(json_list: list[dict], items: Mapping[str, Item]) -> dict[str, CustomerOrder]:
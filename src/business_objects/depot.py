@@ -1,23 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
 from .truck import Truck
 
 
-@dataclass
+@dataclass(slots=True)
 class Depot:
     """
     Central facility for a delivery day.
     `available_trucks` holds *instances* that can be mutated by planners
     (loads, schedules…), so pass copies if you need isolation across runs.
+    Its ids are snapshotted once into `available_truck_ids` for planners.
     """
     depot_id: str
     location: str
     available_trucks: Dict[str, Truck]
 
+    # Derived: ordered truck ids, read by planners on every candidate scan
+    available_truck_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.available_truck_ids = tuple(self.available_trucks)
+
     def truck_ids(self):
-        return list(self.available_trucks.keys())
+        return list(self.available_truck_ids)
 
     def get_truck(self, truck_id: str) -> Truck:
         return self.available_trucks[truck_id]
@@ -2,11 +2,9 @@
 from __future__ import annotations
 import os
 import json
-from datetime import datetime
 
 import random
-from dataclasses import asdict
-from datetime import datetime, timedelta
+import sys
 from typing import Dict, Mapping, Tuple, List
 
 from .common import Dimensions, Fragility, SeparationTag, TruckType
@@ -18,8 +16,14 @@ from .depot import Depot
 from .config import (
     InstanceGenConfig,
     TruckSpec,
+    sub_rng,
 )
 
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
 
 # -------------------------------------------------------------------
 # Public API
@@ -38,13 +42,14 @@ def make_objects(cfg: InstanceGenConfig) -> Dict[str, object]:
       5) Depots (availability policy: all or sample)
     """
     cfg.validate()
-    rng = random.Random(cfg.seed)
+    seed = cfg.seed
 
-    items = _gen_items(rng, cfg)
-    customers = _gen_customers(rng, cfg)
-    orders = _gen_orders(rng, cfg, customers=customers, items=items)
-    trucks = _gen_trucks(rng, cfg)
-    depots = _gen_depots(rng, cfg, trucks=trucks)
+    # one independent stream per subsystem (see config.sub_rng)
+    items = _gen_items(sub_rng(seed, "items"), cfg)
+    customers = _gen_customers(sub_rng(seed, "customers"), cfg)
+    orders = _gen_orders(sub_rng(seed, "orders"), cfg, customers=customers, items=items)
+    trucks = _gen_trucks(sub_rng(seed, "trucks"), cfg)
+    depots = _gen_depots(sub_rng(seed, "depots"), cfg, trucks=trucks)
 
     return {
         "depots": depots,
@@ -59,15 +64,28 @@ def make_objects(cfg: InstanceGenConfig) -> Dict[str, object]:
 # Items
 # -------------------------------------------------------------------
 
+_FRAGILITIES = tuple(Fragility)
+_SEPARATION_TAGS = tuple(SeparationTag)
+_STACK_LOADS_KG = (5, 10, 20, 50, 100, 150)
+
+
 def _gen_items(rng: random.Random, cfg: InstanceGenConfig) -> Dict[str, Item]:
     itcfg = cfg.items
     items: Dict[str, Item] = {}
+
+    # loop invariants hoisted; draw order is unchanged so seeds reproduce
+    rand, uniform, choice = rng.random, rng.uniform, rng.choice
+    cold_ratio = itcfg.cold_ratio
+    w_lo, w_hi = itcfg.weight_kg
+    v_lo, v_hi = itcfg.volume_m3
+    p_lo, p_hi = itcfg.padding
+
     for i in range(1, itcfg.num_items + 1):
-        iid = f"I{i:03d}"
-        is_cold = rng.random() < itcfg.cold_ratio
-        weight = round(rng.uniform(*itcfg.weight_kg), 2)
-        vol = round(rng.uniform(*itcfg.volume_m3), 4)
-        pad = round(rng.uniform(*itcfg.padding), 2)
+        iid = sys.intern(f"I{i:03d}")
+        is_cold = rand() < cold_ratio
+        weight = round(uniform(w_lo, w_hi), 2)
+        vol = round(uniform(v_lo, v_hi), 4)
+        pad = round(uniform(p_lo, p_hi), 2)
 
         items[iid] = Item(
             item_id=iid,
@@ -76,11 +94,11 @@ def _gen_items(rng: random.Random, cfg: InstanceGenConfig) -> Dict[str, Item]:
             unit_weight_kg=weight,
             unit_volume_m3=vol,
             dims_m=Dimensions(0.2, 0.2, 0.2),
-            fragility=rng.choice(list(Fragility)),
-            max_stack_load_kg=rng.choice([5, 10, 20, 50, 100, 150]),
-            is_liquid=(rng.random() < 0.2),
-            upright_only=(rng.random() < 0.2),
-            separation_tag=rng.choice(list(SeparationTag)),
+            fragility=choice(_FRAGILITIES),
+            max_stack_load_kg=choice(_STACK_LOADS_KG),
+            is_liquid=(rand() < 0.2),
+            upright_only=(rand() < 0.2),
+            separation_tag=choice(_SEPARATION_TAGS),
             padding_factor=pad,
         )
     return items
@@ -94,7 +112,7 @@ def _gen_customers(rng: random.Random, cfg: InstanceGenConfig) -> Dict[str, Cust
     ccfg = cfg.customers
     customers: Dict[str, Customer] = {}
     for i in range(1, ccfg.num_customers + 1):
-        cid = f"C{i:03d}"
+        cid = sys.intern(f"C{i:03d}")
         customers[cid] = Customer(
             customer_id=cid,
             name=f"Customer_{i}",
@@ -109,16 +127,16 @@ def _gen_customers(rng: random.Random, cfg: InstanceGenConfig) -> Dict[str, Cust
 # Orders
 # -------------------------------------------------------------------
 
-def _rand_time_between(rng: random.Random, start_hhmm: str, end_hhmm: str) -> str:
-    base = datetime.now().replace(second=0, microsecond=0)
-    s = datetime.strptime(start_hhmm, "%H:%M").replace(year=base.year, month=base.month, day=base.day)
-    e = datetime.strptime(end_hhmm, "%H:%M").replace(year=base.year, month=base.month, day=base.day)
+def _hhmm_to_minutes(hhmm: str) -> int:
+    hh, mm = hhmm.split(":")
+    return int(hh) * 60 + int(mm)
+
+
+def _rand_time_between(rng: random.Random, start_min: int, end_min: int) -> str:
+    """Random 'HH:MM' in [start_min, end_min] (minutes since midnight)."""
     # clamp to ensure s <= e
-    if e < s:
-        e = s
-    total_minutes = int((e - s).total_seconds() // 60)
-    offset = rng.randint(0, max(0, total_minutes))
-    return (s + timedelta(minutes=offset)).strftime("%H:%M")
+    total = start_min + rng.randint(0, max(0, end_min - start_min))
+    return f"{total // 60:02d}:{total % 60:02d}"
 
 
 def _gen_orders(
@@ -129,24 +147,34 @@ def _gen_orders(
     items: Mapping[str, Item],
 ) -> Dict[str, CustomerOrder]:
     ocfg = cfg.orders
-    all_customers = list(customers.values())
-    item_ids = list(items.keys())
+    # tuples: built once, indexed directly by rng.choice / rng.sample
+    all_customers = tuple(customers.values())
+    item_ids = tuple(items)
     orders: Dict[str, CustomerOrder] = {}
+    # due-time window parsed once, as minutes since midnight
+    earliest_min = _hhmm_to_minutes(ocfg.earliest_due)
+    latest_min = _hhmm_to_minutes(ocfg.latest_due)
+    # other loop invariants
+    randint, choice = rng.randint, rng.choice
+    k_lo, k_hi = ocfg.items_per_order
+    qty_lo, qty_hi = ocfg.qty_per_item
+    max_cf = ocfg.max_cold_fraction
+    clamp_cf = max_cf < 1.0  # αᵢ ≤ 1 always, so 1.0 disables the clamp
 
     for i in range(1, ocfg.num_orders + 1):
-        oid = f"O{i:04d}"
-        cust = rng.choice(all_customers)
+        oid = sys.intern(f"O{i:04d}")
+        cust = choice(all_customers)
 
         # number of DISTINCT item types per order
-        k_types = rng.randint(*ocfg.items_per_order)
+        k_types = randint(k_lo, k_hi)
         k_types = min(k_types, len(item_ids))
         chosen = rng.sample(item_ids, k_types)
 
         # quantity per item type (inclusive range)
-        item_list: Dict[str, int] = {iid: rng.randint(*ocfg.qty_per_item) for iid in chosen}
+        item_list: Dict[str, int] = {iid: randint(qty_lo, qty_hi) for iid in chosen}
 
         # due time in [earliest_due, latest_due] and (by your rule) latest ≤ 22:00
-        due_str = _rand_time_between(rng, ocfg.earliest_due, ocfg.latest_due)
+        due_str = _rand_time_between(rng, earliest_min, latest_min)
 
         # build order and compute aggregates from items
         order = CustomerOrder(
@@ -154,15 +182,14 @@ def _gen_orders(
             customer_id=cust.customer_id,
             item_list=item_list,
             due_time_str=due_str,
+            validate=False,  # generated ids/quantities are str/int by construction
         )
         order.compute_from_items(items)
 
         # optional clamp cold fraction (αᵢ) if requested
-        if order.total_volume_m3 > 1e-9:
-            max_cf = ocfg.max_cold_fraction
-            if order.cold_fraction > max_cf:
-                order.cold_volume_m3 = max_cf * order.total_volume_m3
-                order.cold_fraction = max_cf
+        if clamp_cf and order.cold_fraction > max_cf and order.total_volume_m3 > 1e-9:
+            order.cold_volume_m3 = max_cf * order.total_volume_m3
+            order.cold_fraction = max_cf
 
         orders[oid] = order
 
@@ -185,35 +212,42 @@ def _gen_trucks(rng: random.Random, cfg: InstanceGenConfig) -> Dict[str, Truck]:
 
     # Otherwise, generate from template counts & ranges.
     trucks: Dict[str, Truck] = {}
+    uniform = rng.uniform
+    total_rng = tcfg.total_capacity_m3
+    cold_rng = tcfg.cold_capacity_m3
+    weight_rng = tcfg.weight_limit_kg
+    cost_rng = tcfg.fixed_cost
+    reserve_rng = tcfg.reserve_fraction
+
     # Cold (reefer) trucks
     for i in range(1, tcfg.num_trucks_cold + 1):
         tid = f"TR{i:03d}"
-        total = round(rng.uniform(*tcfg.total_capacity_m3), 1)
-        cold = round(rng.uniform(*tcfg.cold_capacity_m3), 1)
+        total = round(uniform(*total_rng), 1)
+        cold = round(uniform(*cold_rng), 1)
         trucks[tid] = Truck(
             truck_id=tid,
             type=TruckType.REEFER,
             total_capacity_m3=total,
             cold_capacity_m3=cold,
-            weight_limit_kg=round(rng.uniform(*tcfg.weight_limit_kg), 1),
-            fixed_cost=round(rng.uniform(*tcfg.fixed_cost), 2),
+            weight_limit_kg=round(uniform(*weight_rng), 1),
+            fixed_cost=round(uniform(*cost_rng), 2),
             min_utilization=tcfg.min_util_cold,
-            reserve_fraction=round(rng.uniform(*tcfg.reserve_fraction), 2),
+            reserve_fraction=round(uniform(*reserve_rng), 2),
         )
 
     # Dry trucks
     for i in range(1, tcfg.num_trucks_dry + 1):
         tid = f"TD{i:03d}"
-        total = round(rng.uniform(*tcfg.total_capacity_m3), 1)
+        total = round(uniform(*total_rng), 1)
         trucks[tid] = Truck(
             truck_id=tid,
             type=TruckType.DRY,
             total_capacity_m3=total,
             cold_capacity_m3=0.0,
-            weight_limit_kg=round(rng.uniform(*tcfg.weight_limit_kg), 1),
-            fixed_cost=round(rng.uniform(*tcfg.fixed_cost), 2),
+            weight_limit_kg=round(uniform(*weight_rng), 1),
+            fixed_cost=round(uniform(*cost_rng), 2),
             min_utilization=tcfg.min_util_dry,
-            reserve_fraction=round(rng.uniform(*tcfg.reserve_fraction), 2),
+            reserve_fraction=round(uniform(*reserve_rng), 2),
         )
     return trucks
 
@@ -243,19 +277,19 @@ def _gen_depots(rng: random.Random, cfg: InstanceGenConfig, *, trucks: Mapping[s
     for i in range(1, dcfg.num_depots + 1):
         did = f"D{i:03d}"
 
-        if dcfg.availability == "all":
-            avail_ids = all_truck_ids
-        elif isinstance(dcfg.availability, tuple) and dcfg.availability[0] == "sample":
+        if isinstance(dcfg.availability, tuple) and dcfg.availability[0] == "sample":
             k = min(dcfg.availability[1], len(all_truck_ids))
             avail_ids = rng.sample(all_truck_ids, k)
+            available = {tid: trucks[tid] for tid in avail_ids}
         else:
-            # Fallback safety; config.validate() should prevent reaching here
-            avail_ids = all_truck_ids
+            # "all" (or fallback safety; config.validate() should prevent other values);
+            # dict(trucks) copies at C speed, and each depot keeps its own mapping
+            available = dict(trucks)
 
         depots[did] = Depot(
             depot_id=did,
             location=f"Depot_{i} City",
-            available_trucks={tid: trucks[tid] for tid in avail_ids},
+            available_trucks=available,
         )
 
     return depots
@@ -265,48 +299,110 @@ def _gen_depots(rng: random.Random, cfg: InstanceGenConfig, *, trucks: Mapping[s
 # Optional: JSON helpers (handy if you want to export)
 # -------------------------------------------------------------------
 
+# Explicit per-type converters: field order matches the dataclass declarations
+# (so files match the former asdict() output) and runtime/derived fields are
+# simply never emitted.
+
+def _customer_to_dict(c: Customer) -> dict:
+    return {
+        "customer_id": c.customer_id,
+        "name": c.name,
+        "email": c.email,
+        "vip": c.vip,
+        "address": c.address,
+    }
+
+
+def _item_to_dict(it: Item) -> dict:
+    dims = it.dims_m
+    return {
+        "item_id": it.item_id,
+        "name": it.name,
+        "category_cold": it.category_cold,
+        "unit_weight_kg": it.unit_weight_kg,
+        "unit_volume_m3": it.unit_volume_m3,
+        "dims_m": {"L": dims.L, "W": dims.W, "H": dims.H},
+        "fragility": it.fragility.value,
+        "max_stack_load_kg": it.max_stack_load_kg,
+        "is_liquid": it.is_liquid,
+        "upright_only": it.upright_only,
+        "separation_tag": it.separation_tag.value,
+        "padding_factor": it.padding_factor,
+    }
+
+
+def _order_to_dict(o: CustomerOrder) -> dict:
+    return {
+        "order_id": o.order_id,
+        "customer_id": o.customer_id,
+        "item_list": dict(o.item_list),
+        "due_time_str": o.due_time_str,
+        "total_volume_m3": o.total_volume_m3,
+        "cold_volume_m3": o.cold_volume_m3,
+        "weight_kg": o.weight_kg,
+        "effective_volume_m3": o.effective_volume_m3,
+        "cold_fraction": o.cold_fraction,
+    }
+
+
+def _truck_to_dict(t: Truck) -> dict:
+    return {
+        "truck_id": t.truck_id,
+        "type": t.type.value,
+        "total_capacity_m3": t.total_capacity_m3,
+        "cold_capacity_m3": t.cold_capacity_m3,
+        "weight_limit_kg": t.weight_limit_kg,
+        "fixed_cost": t.fixed_cost,
+        "min_utilization": t.min_utilization,
+        "reserve_fraction": t.reserve_fraction,
+        "cooler_capacity_m3": t.cooler_capacity_m3,
+    }
+
+
+def _depot_to_dict(d: Depot) -> dict:
+    return {
+        "depot_id": d.depot_id,
+        "location": d.location,
+        "available_trucks": list(d.available_truck_ids),
+    }
+
+
+# (file stem, converter) in output order
+_EXPORTERS = (
+    ("depots", _depot_to_dict),
+    ("customers", _customer_to_dict),
+    ("orders", _order_to_dict),
+    ("items", _item_to_dict),
+    ("trucks", _truck_to_dict),
+)
+
+
 def export_as_jsonable_dicts(objs: Dict[str, object]) -> Dict[str, List[dict]]:
     """
     Convert generated dataclass objects into plain dicts so you can dump to JSON.
     Runtime fields on Truck and datetime fields on Order are stripped.
     """
-    depots = []
-    for d in objs["depots"].values():
-        depots.append({
-            "depot_id": d.depot_id,
-            "location": d.location,
-            "available_trucks": list(d.available_trucks.keys()),
-        })
-
-    customers = [asdict(c) for c in objs["customers"].values()]
-
-    orders = []
-    for o in objs["orders"].values():
-        data = asdict(o)
-        data.pop("due_dt", None)
-        orders.append(data)
-
-    items = [asdict(it) for it in objs["items"].values()]
-
-    trucks = []
-    for t in objs["trucks"].values():
-        td = asdict(t)
-        # strip runtime fields
-        td.pop("assigned_orders", None)
-        td.pop("used_volume_m3", None)
-        td.pop("used_cold_m3", None)
-        td.pop("used_weight_kg", None)
-        td.pop("departure_time", None)
-        td.pop("schedule", None)
-        trucks.append(td)
+    return {name: [to_dict(x) for x in objs[name].values()] for name, to_dict in _EXPORTERS}
 
-    return {
-        "depots": depots,
-        "customers": customers,
-        "orders": orders,
-        "items": items,
-        "trucks": trucks,
-    }
+
+def _write_json_array(path: str, records) -> int:
+    """
+    Write `records` as an indent=2 JSON array, serializing one record at a time
+    (same bytes as dumping the whole list). Returns the number of records.
+    """
+    n = 0
+    with open(path, "wb") as f:
+        for rec in records:
+            if orjson is not None:
+                # Enums serialize natively; output is UTF-8 like ensure_ascii=False
+                body = orjson.dumps(rec, option=orjson.OPT_INDENT_2)
+            else:
+                body = json.dumps(rec, indent=2, ensure_ascii=False).encode("utf-8")
+            f.write(b",\n  " if n else b"[\n  ")
+            f.write(body.replace(b"\n", b"\n  "))  # nest one level inside the array
+            n += 1
+        f.write(b"\n]" if n else b"[]")
+    return n
 
 
 def save_json_files(objs: Dict[str, object], output_dir: str) -> None:
@@ -328,15 +424,11 @@ def save_json_files(objs: Dict[str, object], output_dir: str) -> None:
         Name or path of directory to save files into.
         (If it does not exist, it will be created.)
     """
-    # Convert all dataclasses → plain dicts
-    jsonable = export_as_jsonable_dicts(objs)
-
     # Ensure directory exists
     os.makedirs(output_dir, exist_ok=True)
 
-    # Loop over each category and dump JSON
-    for name, data in jsonable.items():
+    # Stream each category: convert + serialize record by record (no full list of dicts)
+    for name, to_dict in _EXPORTERS:
         filename = os.path.join(output_dir, f"{name}.json")
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        print(f"Saved {len(data)} records to {filename}")
+        n = _write_json_array(filename, map(to_dict, objs[name].values()))
+        print(f"Saved {n} records to {filename}")
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from .common import Dimensions, Fragility, SeparationTag
 
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """
     Catalog item with handling and safety attributes.
@@ -28,6 +28,12 @@ class Item:
     separation_tag: SeparationTag
     padding_factor: float = 0.0      # fraction; applied by packing/planning layer
 
+    # Derived (cached at construction; catalog items are not edited in place)
+    _eff_unit_volume_m3: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._eff_unit_volume_m3 = float(self.unit_volume_m3 * (1.0 + max(0.0, self.padding_factor)))
+
     def effective_unit_volume(self) -> float:
         """Volume inflated by padding (if any)."""
-        return float(self.unit_volume_m3 * (1.0 + max(0.0, self.padding_factor)))
+        return self._eff_unit_volume_m3
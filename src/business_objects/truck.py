@@ -5,14 +5,14 @@ from typing import List, Tuple, Optional
 from .common import TruckType
 
 
-@dataclass
+@dataclass(slots=True)
 class Truck:
     """
     Vehicle resource with capacity, cold-chain, and utilization policy.
 
     The scheduling/assignment layers can write to the runtime fields:
     - assigned_orders
-    - used_volume_m3 / used_cold_m3 / used_weight_kg
+    - used_volume_m3 / used_cold_m3 / used_weight_kg / used_cooler_m3
     - departure_time / schedule
     """
     truck_id: str
@@ -33,6 +33,7 @@ class Truck:
     schedule: List[Tuple[str, str]] = field(default_factory=list, repr=False)  # (order_id, eta 'HH:MM')
 
     cooler_capacity_m3: float = 0.0  # optional, used for dry trucks with built-in coolers
+    used_cooler_m3: float = field(default=0.0, repr=False)  # runtime: cold volume carried in coolers
     # ---------- convenience ----------
     def residual_volume_m3(self) -> float:
         """Remaining usable volume after reserve is honored."""
@@ -58,5 +59,6 @@ class Truck:
         self.used_volume_m3 = 0.0
         self.used_cold_m3 = 0.0
         self.used_weight_kg = 0.0
+        self.used_cooler_m3 = 0.0
         self.departure_time = None
         self.schedule.clear()
@@ -107,7 +107,8 @@ class Policy(Protocol):
       - day_bottleneck: str           # 'volume' or 'weight' (tie-break preference)
     """
 
-    ...
+    # Build AssignOrder.rationale; when off, placers leave it as "" (the AssignOrder default)
+    log_rationale: bool = False
 
 
 # ──────────────────────────────────────────────────────────────────────────────
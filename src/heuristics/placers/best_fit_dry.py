@@ -4,11 +4,14 @@ from typing import Optional, Tuple, Sequence, Literal
 
 from .base import StateView, FeasibilityService, Policy, PackingPolicy, AssignOrder
 from .best_fit_reefer import choose_best_open_reefer  # reuse the reefer chooser we already have
+from .fit_scoring import FitScore, fitting_trucks, is_perfect_fit, linf_score
 
 ReeferRankDim = Literal["cold", "volume", "weight"]
 RankDim = Literal["volume", "weight"]  # dry trucks have no native cold capacity
 DryRankDim = Literal["volume", "weight"]
 
+_DRY_DIM_INDEX = {"volume": 0, "weight": 1}
+
 
 def _residual_key_dry(
     *,
@@ -25,22 +28,19 @@ def _residual_key_dry(
     f = state.order_features(order_id)
     r = state.truck_residuals(truck_id)
 
-    demand = {
-        "volume": float(f.effective_volume_m3),
-        "weight": float(f.weight_kg),
-    }
-    resid = {
-        "volume": float(r.remaining_volume_m3),
-        "weight": float(r.remaining_weight_kg),
-    }
+    # leftovers in canonical (volume, weight) order; scheme picks the priority
+    leftover = (
+        float(r.remaining_volume_m3) - float(f.effective_volume_m3),
+        float(r.remaining_weight_kg) - float(f.weight_kg),
+    )
+    key = tuple(leftover[_DRY_DIM_INDEX[dim]] for dim in scheme)
 
     # must fit both requested dims in scheme
-    for dim in scheme:
-        if resid[dim] - demand[dim] < 0:
-            return None
+    if key and min(key) < 0:
+        return None
 
     # lexicographic tuple of leftover per the requested priority
-    return tuple(resid[dim] - demand[dim] for dim in scheme)
+    return key
 
 
 def choose_best_open_dry(
@@ -50,25 +50,29 @@ def choose_best_open_dry(
     order_id: str,
     *,
     scheme: Sequence[RankDim] = ("volume", "weight"),
+    fit_score: FitScore = "lex",
 ) -> Optional[str]:
     """
     Among open DRY trucks, pick the best-fitting truck for `order_id` using a
     configurable priority scheme (default: volume → weight).
     For orders with cold volume, feasibility must include cooler checks.
+    With fit_score="linf" trucks are ranked by their largest normalized leftover.
     """
-    best: Optional[Tuple[Tuple[float, ...], str]] = None
-
-    for tid in state.open_trucks(type_filter="dry"):
-        # Must pass feasibility (this should include cooler feasibility if order has cold volume)
-        if not feas.fits_order_on_truck(state, order_id, tid, policy):
-            continue
+    best: Optional[Tuple[Tuple[float, ...] | float, str]] = None
+    open_dry = state.open_trucks(type_filter="dry")
 
+    # Must pass feasibility (this should include cooler feasibility if order has cold volume)
+    for tid in fitting_trucks(state, feas, policy, order_id, open_dry, check_cold=False):
         key = _residual_key_dry(state=state, order_id=order_id, truck_id=tid, scheme=scheme)
         if key is None:
             continue
+        if fit_score == "linf":
+            key = linf_score(state=state, truck_id=tid, scheme=scheme, leftover=key)
 
         if best is None or key < best[0]:
             best = (key, tid)
+            if is_perfect_fit(key):
+                break  # leftovers are never negative, so no later truck can beat this
 
     return None if best is None else best[1]
 
@@ -92,23 +96,24 @@ def maybe_open_new_dry(
       - Return the truck_id of the first feasible candidate; else None.
     """
     # 1) policy gate
-    if not getattr(policy, "allow_open_new_dry_B", False):
+    if not policy.allow_open_new_dry_B:
         return None
 
     # 2) candidate DRY trucks: available minus currently open
-    open_ids = set(state.open_trucks(type_filter="dry"))
-    all_dry = set(state.all_available_trucks(type_filter="dry"))
-    candidates = sorted(all_dry - open_ids)
+    if hasattr(state, "closed_trucks"):
+        candidates = state.closed_trucks(type_filter="dry")  # kept sorted by the view
+    else:
+        open_ids = set(state.open_trucks(type_filter="dry"))
+        candidates = sorted(
+            tid for tid in state.all_available_trucks(type_filter="dry") if tid not in open_ids
+        )
 
     # 3) check feasibility per candidate
     f = state.order_features(order_id)
-    order_has_cold = float(getattr(f, "cold_volume_m3", 0.0)) > 0.0
-
-    for tid in candidates:
-        # base capacity & rules
-        if not feas.fits_order_on_truck(state, order_id, tid, policy):
-            continue
+    order_has_cold = f.cold_volume_m3 > 0.0
 
+    # base capacity & rules
+    for tid in fitting_trucks(state, feas, policy, order_id, candidates, check_cold=False):
         # extra cooler requirement for cold-in-dry
         if order_has_cold:
             if not feas.cooler_feasible(state, order_id, tid, policy):
@@ -128,6 +133,7 @@ def assign_bucket_b_order(
     packing_policy: PackingPolicy,
     reefer_scheme: Sequence[ReeferRankDim] = ("cold", "volume", "weight"),
     dry_scheme: Sequence[DryRankDim] = ("volume", "weight"),
+    fit_score: FitScore = "lex",
 ) -> Optional[AssignOrder]:
     """
     Bucket B orchestration (flexible orders with some cold or dry-only):
@@ -141,38 +147,44 @@ def assign_bucket_b_order(
     """
     # ---------- step 1: existing reefers only ----------
     reefer_tid = choose_best_open_reefer(
-        state=state, feas=feas, policy=policy, order_id=order_id, scheme=reefer_scheme
+        state=state, feas=feas, policy=policy, order_id=order_id, scheme=reefer_scheme,
+        fit_score=fit_score,
     )
     if reefer_tid is not None:
         plan = packing_policy.plan(state, reefer_tid, order_id)
         if plan is None:
             return None
-        f = state.order_features(order_id)
-        r = state.truck_residuals(reefer_tid)
-        rationale = (
-            f"BucketB: used existing reefer "
-            f"(scheme={list(reefer_scheme)}; "
-            f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
-            f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔQ_cold={r.remaining_cold_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
-        )
+        rationale = ""
+        if policy.log_rationale:
+            f = state.order_features(order_id)
+            r = state.truck_residuals(reefer_tid)
+            rationale = (
+                f"BucketB: used existing reefer "
+                f"(scheme={list(reefer_scheme)}; "
+                f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
+                f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔQ_cold={r.remaining_cold_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
+            )
         return AssignOrder(order_id=order_id, truck_id=reefer_tid, packing=plan, rationale=rationale)
 
     # ---------- step 2: open dry trucks ----------
     dry_tid = choose_best_open_dry(
-        state=state, feas=feas, policy=policy, order_id=order_id, scheme=dry_scheme
+        state=state, feas=feas, policy=policy, order_id=order_id, scheme=dry_scheme,
+        fit_score=fit_score,
     )
     if dry_tid is not None:
         plan = packing_policy.plan(state, dry_tid, order_id)
         if plan is None:
             return None
-        f = state.order_features(order_id)
-        r = state.truck_residuals(dry_tid)
-        rationale = (
-            f"BucketB: used open dry "
-            f"(scheme={list(dry_scheme)}; "
-            f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
-            f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
-        )
+        rationale = ""
+        if policy.log_rationale:
+            f = state.order_features(order_id)
+            r = state.truck_residuals(dry_tid)
+            rationale = (
+                f"BucketB: used open dry "
+                f"(scheme={list(dry_scheme)}; "
+                f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
+                f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
+            )
         return AssignOrder(order_id=order_id, truck_id=dry_tid, packing=plan, rationale=rationale)
 
     # ---------- step 3: maybe open new dry (policy-gated) ----------
@@ -183,14 +195,16 @@ def assign_bucket_b_order(
         plan = packing_policy.plan(state, new_dry_tid, order_id)
         if plan is None:
             return None
-        f = state.order_features(order_id)
-        r = state.truck_residuals(new_dry_tid)
-        rationale = (
-            f"BucketB: opened new dry "
-            f"(scheme={list(dry_scheme)}; "
-            f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
-            f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
-        )
+        rationale = ""
+        if policy.log_rationale:
+            f = state.order_features(order_id)
+            r = state.truck_residuals(new_dry_tid)
+            rationale = (
+                f"BucketB: opened new dry "
+                f"(scheme={list(dry_scheme)}; "
+                f"order v_eff={f.effective_volume_m3:.4f}, q_cold={f.cold_volume_m3:.4f}, w={f.weight_kg:.1f}; "
+                f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f})"
+            )
         return AssignOrder(order_id=order_id, truck_id=new_dry_tid, packing=plan, rationale=rationale)
 
     # nothing feasible under policy
@@ -205,6 +219,7 @@ def assign_bucket_c_order(
     *,
     packing_policy: PackingPolicy,
     dry_scheme: Sequence[DryRankDim] = ("volume", "weight"),
+    fit_score: FitScore = "lex",
 ) -> Optional[AssignOrder]:
     """
     Bucket C (dry-only) placement:
@@ -213,7 +228,7 @@ def assign_bucket_c_order(
       3) Else return None.
     """
     # 1) open dry
-    tid = choose_best_open_dry(state, feas, policy, order_id, scheme=dry_scheme)
+    tid = choose_best_open_dry(state, feas, policy, order_id, scheme=dry_scheme, fit_score=fit_score)
     if tid is None:
         # 2) maybe open new dry (policy-gated)
         tid = maybe_open_new_dry(state, feas, policy, order_id=order_id)
@@ -225,13 +240,15 @@ def assign_bucket_c_order(
     if plan is None:
         return None
 
-    f = state.order_features(order_id)
-    r = state.truck_residuals(tid)
-    rationale = (
-        f"BucketC: dry-only; scheme={list(dry_scheme)}; "
-        f"order v_eff={f.effective_volume_m3:.4f}, w={f.weight_kg:.1f}; "
-        f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f}"
-    )
+    rationale = ""
+    if policy.log_rationale:
+        f = state.order_features(order_id)
+        r = state.truck_residuals(tid)
+        rationale = (
+            f"BucketC: dry-only; scheme={list(dry_scheme)}; "
+            f"order v_eff={f.effective_volume_m3:.4f}, w={f.weight_kg:.1f}; "
+            f"truck ΔQ={r.remaining_volume_m3:.4f}, ΔW={r.remaining_weight_kg:.1f}"
+        )
     return AssignOrder(order_id=order_id, truck_id=tid, packing=plan, rationale=rationale)
 
 
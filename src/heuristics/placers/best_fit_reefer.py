@@ -2,9 +2,12 @@ from __future__ import annotations
 from typing import Optional, Tuple, Sequence, Literal
 
 from .base import StateView, FeasibilityService, Policy, PackingPolicy, AssignOrder
+from .fit_scoring import FitScore, fitting_trucks, is_perfect_fit, linf_score
 
 RankDim = Literal["cold", "volume", "weight"]
 
+_DIM_INDEX = {"cold": 0, "volume": 1, "weight": 2}
+
 
 def _residual_key(
     *,
@@ -20,24 +23,20 @@ def _residual_key(
     f = state.order_features(order_id)
     r = state.truck_residuals(truck_id)
 
-    demand = {
-        "cold":   float(f.cold_volume_m3),
-        "volume": float(f.effective_volume_m3),
-        "weight": float(f.weight_kg),
-    }
-    resid = {
-        "cold":   float(r.remaining_cold_m3),
-        "volume": float(r.remaining_volume_m3),
-        "weight": float(r.remaining_weight_kg),
-    }
+    # leftovers in canonical (cold, volume, weight) order; scheme picks the priority
+    leftover = (
+        float(r.remaining_cold_m3) - float(f.cold_volume_m3),
+        float(r.remaining_volume_m3) - float(f.effective_volume_m3),
+        float(r.remaining_weight_kg) - float(f.weight_kg),
+    )
+    key = tuple(leftover[_DIM_INDEX[dim]] for dim in scheme)
 
     # must fit all constrained dimensions present in scheme
-    for dim in scheme:
-        if resid[dim] - demand[dim] < 0:
-            return None
+    if key and min(key) < 0:
+        return None
 
     # lexicographic tuple of leftover per the requested priority
-    return tuple(resid[dim] - demand[dim] for dim in scheme)
+    return key
 
 
 def choose_best_open_reefer(
@@ -47,22 +46,27 @@ def choose_best_open_reefer(
     order_id: str,
     *,
     scheme: Sequence[RankDim] = ("cold", "volume", "weight"),
+    fit_score: FitScore = "lex",
 ) -> Optional[str]:
     """
     Among open reefers, pick best-fitting truck for `order_id` using a configurable
     priority scheme (default: cold → volume → weight). Smaller leftover is better.
+    With fit_score="linf" the scheme's dims are ranked by their largest normalized
+    leftover instead of lexicographically.
     """
-    best: Optional[Tuple[Tuple[float, ...], str]] = None
-    for tid in state.open_trucks(type_filter="reefer"):
-        if not feas.fits_order_on_truck(state, order_id, tid, policy):
-            continue
-
+    best: Optional[Tuple[Tuple[float, ...] | float, str]] = None
+    open_reefers = state.open_trucks(type_filter="reefer")
+    for tid in fitting_trucks(state, feas, policy, order_id, open_reefers, check_cold=True):
         key = _residual_key(state=state, order_id=order_id, truck_id=tid, scheme=scheme)
         if key is None:
             continue
+        if fit_score == "linf":
+            key = linf_score(state=state, truck_id=tid, scheme=scheme, leftover=key)
 
         if best is None or key < best[0]:
             best = (key, tid)
+            if is_perfect_fit(key):
+                break  # leftovers are never negative, so no later truck can beat this
 
     return None if best is None else best[1]
 
@@ -88,22 +92,21 @@ def maybe_open_new_reefer(
         str | None – ID of the new reefer opened, or None if not allowed or none fit.
     """
     # 1. policy gate
-    if not getattr(policy, "allow_open_new_reefer_A", False):
+    if not policy.allow_open_new_reefer_A:
         return None
 
     # 2. candidates: all available reefers not already open
-    open_ids = set(state.open_trucks(type_filter="reefer"))
-    all_ids = set(state.all_available_trucks(type_filter="reefer"))
-    candidates = sorted(all_ids - open_ids)
-
-    # 3. find first feasible reefer that can hold this order
-    for tid in candidates:
-        if feas.fits_order_on_truck(state, order_id, tid, policy):
-            # later: planner would call tracker.open_truck(tid, …)
-            return tid
+    if hasattr(state, "closed_trucks"):
+        candidates = state.closed_trucks(type_filter="reefer")  # kept sorted by the view
+    else:
+        open_ids = set(state.open_trucks(type_filter="reefer"))
+        candidates = sorted(
+            tid for tid in state.all_available_trucks(type_filter="reefer") if tid not in open_ids
+        )
 
-    # 4. none fit
-    return None
+    # 3. first feasible reefer that can hold this order (None if none fit)
+    # later: planner would call tracker.open_truck(tid, …)
+    return next(fitting_trucks(state, feas, policy, order_id, candidates, check_cold=True), None)
 
 
 def assign_to_best_reefer(
@@ -114,6 +117,7 @@ def assign_to_best_reefer(
     *,
     packing_policy: PackingPolicy,
     ranking_scheme: Sequence[RankDim] = ("cold", "volume", "weight"),
+    fit_score: FitScore = "lex",
 ) -> Optional[AssignOrder]:
     """
     Try to assign `order_id` to the best refrigerated truck.
@@ -130,11 +134,12 @@ def assign_to_best_reefer(
           - AssignOrder.order_id
           - AssignOrder.plan (LoadingPlan)
           - AssignOrder.opened_new_truck (bool)
-          - AssignOrder.rationale (dict)
+          - AssignOrder.rationale (dict when policy.log_rationale, else "")
     """
     # 1) try open reefers first
     tid = choose_best_open_reefer(
-        state=state, feas=feas, policy=policy, order_id=order_id, scheme=ranking_scheme
+        state=state, feas=feas, policy=policy, order_id=order_id, scheme=ranking_scheme,
+        fit_score=fit_score,
     )
     opened_new = False
 
@@ -152,23 +157,25 @@ def assign_to_best_reefer(
         # Very defensive: if a policy refuses to plan (should be rare given feasibility gate)
         return None
 
-    # 4) wrap the decision
-    f = state.order_features(order_id)
-    r = state.truck_residuals(tid)
-    rationale = {
-        "scheme": list(ranking_scheme),
-        "order": {
-            "v_eff": float(f.effective_volume_m3),
-            "q_cold": float(f.cold_volume_m3),
-            "w": float(f.weight_kg),
-        },
-        "truck_residuals_before": {
-            "ΔQ": float(r.remaining_volume_m3),
-            "ΔQ_cold": float(r.remaining_cold_m3),
-            "ΔW": float(r.remaining_weight_kg),
-        },
-        "opened_new_truck": opened_new,
-    }
+    # 4) wrap the decision (rationale only when the policy asks for it)
+    rationale = ""
+    if policy.log_rationale:
+        f = state.order_features(order_id)
+        r = state.truck_residuals(tid)
+        rationale = {
+            "scheme": list(ranking_scheme),
+            "order": {
+                "v_eff": float(f.effective_volume_m3),
+                "q_cold": float(f.cold_volume_m3),
+                "w": float(f.weight_kg),
+            },
+            "truck_residuals_before": {
+                "ΔQ": float(r.remaining_volume_m3),
+                "ΔQ_cold": float(r.remaining_cold_m3),
+                "ΔW": float(r.remaining_weight_kg),
+            },
+            "opened_new_truck": opened_new,
+        }
 
     return AssignOrder(
         truck_id=tid,
@@ -26,27 +26,34 @@ class SimpleFeasibility(FeasibilityService):
                 if r.remaining_cold_m3 < f.cold_volume_m3:
                     return False
             else:  # dry truck with portable cooler
-                if not self.cooler_feasible(state, order_id, truck_id, policy):
+                if not self._cooler(f, r, t, policy):
                     return False
         return True
 
     def cooler_feasible(self, state: StateView, order_id: str, truck_id: str, policy: Policy) -> bool:
+        return self._cooler(
+            state.order_features(order_id),
+            state.truck_residuals(truck_id),
+            state.truck_features(truck_id),
+            policy,
+        )
+
+    # ----------------------------- internals ---------------------------- #
+
+    @staticmethod
+    def _cooler(of, r, tfeat, policy: Policy) -> bool:
+        """Cooler check on already-fetched order features, residuals and truck features."""
         # gate by policy
-        if not bool(getattr(policy, "allow_cold_in_dry_B", False)):
+        if not policy.allow_cold_in_dry_B:
             return False
-
-        tfeat = state.truck_features(truck_id)
-        if str(getattr(tfeat, "type", "")).lower() != "dry":
+        if tfeat.type != "dry":
             return False
 
-        of = state.order_features(order_id)
         q_cold = float(of.cold_volume_m3)
         if q_cold <= 0.0:
             # called only for cold-in-dry paths; treat as "no cooler needed"
             return False  # or True if you call this unconditionally elsewhere
 
-        r = state.truck_residuals(truck_id)
-
         # try residual view first
         remaining_cooler = None
         if hasattr(r, "remaining_cooler_m3"):
@@ -54,11 +61,7 @@ class SimpleFeasibility(FeasibilityService):
 
         if remaining_cooler is None:
             used = float(getattr(r, "cooler_used_m3", 0.0))
-            cap = float(
-                getattr(tfeat, "cooler_capacity_m3",
-                        getattr(policy, "per_truck_cooler_m3", 0.0))
-            )
+            cap = float(getattr(tfeat, "cooler_capacity_m3", policy.per_truck_cooler_m3))
             remaining_cooler = max(0.0, cap - used)
 
         return (remaining_cooler + EPS) >= q_cold
-
@@ -0,0 +1,77 @@
+# src/heuristics/placers/fit_scoring.py
+from __future__ import annotations
+from typing import Iterable, Iterator, Literal, Sequence, Tuple
+
+from .base import StateView, FeasibilityService, Policy
+
+# How best-fit choosers rank candidate trucks by leftover:
+#   "lex"  – lexicographic tuple of leftovers in the scheme's priority order
+#   "linf" – largest capacity-normalized leftover among the scheme's dims
+FitScore = Literal["lex", "linf"]
+
+_CAPACITY_ATTR = {"cold": "cold_capacity_m3", "volume": "capacity_m3", "weight": "weight_limit_kg"}
+
+
+def linf_score(
+    *,
+    state: StateView,
+    truck_id: str,
+    scheme: Sequence[str],
+    leftover: Tuple[float, ...],
+) -> float:
+    """
+    ℓ∞ fit score: the largest leftover among the scheme's dims, each normalized by
+    the truck's capacity in that dim (dims with no capacity are skipped).
+    Smaller is better; `leftover` is the key returned by a residual-key builder.
+    """
+    tf = state.truck_features(truck_id)
+    score = 0.0
+    for dim, left in zip(scheme, leftover):
+        cap = float(getattr(tf, _CAPACITY_ATTR[dim], 0.0))
+        if cap > 0.0 and left / cap > score:
+            score = left / cap
+    return score
+
+
+def exceeds_capacity(f, caps: Tuple[float, float, float], *, check_cold: bool) -> bool:
+    """
+    Cheap necessary-condition check against a truck's usable (volume, cold, weight)
+    capacities, weight first. Residuals never exceed usable capacity, so True
+    means the order cannot fit and full feasibility can be skipped.
+    """
+    vol_cap, cold_cap, wt_cap = caps
+    return (
+        f.weight_kg > wt_cap
+        or (check_cold and f.cold_volume_m3 > cold_cap)
+        or f.effective_volume_m3 > vol_cap
+    )
+
+
+def fitting_trucks(
+    state: StateView,
+    feas: FeasibilityService,
+    policy: Policy,
+    order_id: str,
+    candidates: Iterable[str],
+    *,
+    check_cold: bool,
+) -> Iterator[str]:
+    """
+    Yield the candidates that pass feasibility for `order_id`, in candidate order.
+    When the state exposes usable_capacities(), trucks that could not hold the
+    order even empty are skipped before the full feasibility check.
+    """
+    f = state.order_features(order_id)
+    usable = getattr(state, "usable_capacities", None)
+    for tid in candidates:
+        if usable is not None and exceeds_capacity(f, usable(tid), check_cold=check_cold):
+            continue
+        if feas.fits_order_on_truck(state, order_id, tid, policy):
+            yield tid
+
+
+def is_perfect_fit(key: Tuple[float, ...] | float) -> bool:
+    """True if a fit key has zero leftover in every ranked dimension."""
+    if isinstance(key, tuple):
+        return not any(key)
+    return key == 0.0
@@ -5,67 +5,82 @@ from typing import Optional, List, Tuple, Dict, Any, Sequence
 from .base import LoadingPlan, PackingPolicy, StateView
 from src.heuristics.selectors.item_selector_priority import ItemRank
 
+# zone / lane indices for the per-plan balance counters; names are emitted in slots
+ZONE_COLD, ZONE_AMBIENT, ZONE_HAZ = 0, 1, 2
+ZONE_NAMES = ("cold", "ambient", "haz")
+LANE_LEFT, LANE_RIGHT = 0, 1
+LANE_NAMES = ("left", "right")
+_HAZARDOUS = "hazardous"  # ItemFeatures.sep_tag is canonical lowercase
+
 
 class SimplePackingPolicy(PackingPolicy):
     """
     STEP 1 (typed): consume pre-sorted Sequence[ItemRank] and map to slots.
     Single zone ('main'), lane 'left', layer 1. No geometry/constraints yet.
+
+    verbose: also emit one debug/audit note per placed item (off by default).
     """
 
+    def __init__(self, *, verbose: bool = False) -> None:
+        self.verbose = verbose
+
     def plan(self, state: StateView, truck_id: str, order_id: str) -> Optional[LoadingPlan]:
         seq: Sequence[ItemRank] = state.sorted_items(order_id)  # must be ItemRank objects
-
+        # sequences are homogeneous (built by the item sorter); check the first element once
+        if seq and not isinstance(seq[0], ItemRank):
+            raise TypeError("state.sorted_items(order_id) must return Sequence[ItemRank]")
 
         placements: List[Tuple[str, int, Dict[str, Any]]] = []
         notes: List[str] = [f"simple-pack: order {order_id} → truck {truck_id}, zone='main', layer=1"]
 
         # simple per-zone lane weights and top-layer counters
-        lane_weight = {"cold": {"left": 0.0, "right": 0.0},
-                       "ambient": {"left": 0.0, "right": 0.0},
-                       "haz": {"left": 0.0, "right": 0.0}}
-        top_layer_next = {"cold": 2, "ambient": 2, "haz": 2}  # start top at 2; floor is layer=1
+        lane_weight = [[0.0, 0.0] for _ in ZONE_NAMES]  # [zone][lane]
+        top_layer_next = [2] * len(ZONE_NAMES)  # start top at 2; floor is layer=1
 
-        for idx, ir in enumerate(seq):
-            if not isinstance(ir, ItemRank):
-                raise TypeError("state.sorted_items(order_id) must return Sequence[ItemRank]")
+        # loop-invariant names bound locally (LOAD_FAST instead of global/attr lookups)
+        add_placement = placements.append
+        zone_names, lane_names = ZONE_NAMES, LANE_NAMES
+        verbose = self.verbose
 
-            f = ir.features or {}
-            # --- features with safe defaults ---
-            w = float(f.get("w_ij", 0.0))  # line weight
-            cold01 = float(f.get("cold01", 0.0))  # line cold volume
-            fragile_score = float(f.get("fragile_score", 0))  # 0 regular, 1 delicate, 2 fragile
-            upright01 = int(f.get("upright01", 0))  # 1 = upright-only
-            sep_tag = str(f.get("sep_tag", "non_food")).lower()  # "hazardous"/"food"/"non_food"/...
+        for idx, ir in enumerate(seq):
+            f = ir.features
+            # --- line features ---
+            w = f.w_ij  # line weight
+            cold01 = f.cold01  # line cold volume
+            fragile_score = f.fragile_score  # 0 regular, 1 delicate, 2 fragile
+            upright01 = int(f.upright01)  # 1 = upright-only
+            sep_tag = f.sep_tag  # already lowercase: "hazardous"/"food"/"non_food"/...
 
             # --- zone selection (Separation + Cold) ---
-            if sep_tag == "hazardous":
-                zone = "haz"  # isolated
+            if sep_tag == _HAZARDOUS:
+                z = ZONE_HAZ  # isolated
             elif cold01 > 0.0:
-                zone = "cold"  # reefer zone
+                z = ZONE_COLD  # reefer zone
             else:
-                zone = "ambient"
+                z = ZONE_AMBIENT
 
             # --- lane by balance (put weight on the lighter lane) ---
-            left_w = lane_weight[zone]["left"]
-            right_w = lane_weight[zone]["right"]
-            lane = "left" if left_w <= right_w else "right"
+            zone_w = lane_weight[z]
+            lane_i = LANE_LEFT if zone_w[LANE_LEFT] <= zone_w[LANE_RIGHT] else LANE_RIGHT
 
             # --- layer: floor for most; fragile/upright to top layer ---
             if (fragile_score >= 1) or (upright01 == 1):
-                layer = top_layer_next[zone]  # assign to current top layer
-                top_layer_next[zone] = layer + 1  # grow top for later fragile/upright
+                layer = top_layer_next[z]  # assign to current top layer
+                top_layer_next[z] = layer + 1  # grow top for later fragile/upright
                 note_layer = "top"
             else:
                 layer = 1  # floor/base
                 note_layer = "floor"
 
             # record placement and update balance
+            zone, lane = zone_names[z], lane_names[lane_i]
             slot = {"zone": zone, "lane": lane, "layer": layer, "pos": idx}
-            placements.append((ir.item_id, int(ir.qty), slot))
-            lane_weight[zone][lane] += w
+            add_placement((ir.item_id, int(ir.qty), slot))
+            zone_w[lane_i] += w
 
             # optional notes for debug/audit
-            notes.append(
-                f"{ir.item_id} x{ir.qty} → {zone}/{lane}/{note_layer} (w={w:.1f}, cold={cold01 > 0.0}, haz={sep_tag == 'hazardous'})")
+            if verbose:
+                notes.append(
+                    f"{ir.item_id} x{ir.qty} → {zone}/{lane}/{note_layer} (w={w:.1f}, cold={cold01 > 0.0}, haz={sep_tag == 'hazardous'})")
 
         return LoadingPlan(placements=placements, notes=notes)
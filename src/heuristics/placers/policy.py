@@ -23,4 +23,7 @@ class SimplePolicy:
 
     allow_open_new_dry_C: bool = True
 
+    # Build human-readable AssignOrder.rationale (off by default; nothing downstream reads it)
+    log_rationale: bool = False
+
 
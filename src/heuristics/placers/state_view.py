@@ -1,4 +1,5 @@
 from __future__ import annotations
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Dict, Iterable, Optional, Sequence, List
 
@@ -9,7 +10,7 @@ from src.business_objects.depot import Depot
 from src.heuristics.selectors.item_selector_priority import ItemRank
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderFeat:
     effective_volume_m3: float
     volume_m3: float
@@ -19,12 +20,15 @@ class OrderFeat:
     vip: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TruckFeat:
     type: str  # "reefer" or "dry"
+    capacity_m3: float = 0.0
+    cold_capacity_m3: float = 0.0
+    weight_limit_kg: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TruckResiduals:
     remaining_volume_m3: float
     remaining_cold_m3: float
@@ -53,18 +57,46 @@ class SimpleStateView(StateView):
     ) -> None:
         self._depot = depot
         self._orders = orders
-        self._open = set(open_truck_ids)
+        # truck_id -> TruckFeat; type and capacities are static for the day
+        self._truck_feat: Dict[str, TruckFeat] = {
+            tid: self._make_truck_feat(t) for tid, t in depot.available_trucks.items()
+        }
+        # truck_id -> (usable volume, cold capacity, weight limit); the same bounds
+        # Truck.residual_*() applies, so residuals are one subtraction per dim
+        self._usable_caps: Dict[str, tuple[float, float, float]] = {
+            tid: self._make_usable_caps(t) for tid, t in depot.available_trucks.items()
+        }
+        # available-but-not-open ids per type, kept sorted for maybe_open_new_* scans
+        self._closed_sorted: Dict[str, List[str]] = {"reefer": [], "dry": []}
+        for tid in sorted(depot.available_truck_ids):
+            self._closed_sorted[self._type_str(tid)].append(tid)
+        self._open: set[str] = set()
+        self._open_by_type: Dict[str, set[str]] = {"reefer": set(), "dry": set()}
+        for tid in open_truck_ids:
+            self.mark_open(tid)
         self._sorted = sorted_items_provider  # order_id -> Sequence[ItemRank]
         self._customers = customers
+        # VIP membership precomputed once; order_features is called per candidate truck
+        self._vip_ids = frozenset(cid for cid, c in customers.items() if getattr(c, "vip", False))
+        # type -> available truck ids; fleet composition is fixed for the day
+        self._all_by_type: Dict[str, tuple[str, ...]] = {
+            kind: tuple(tid for tid in depot.available_truck_ids if self._type_str(tid) == kind)
+            for kind in ("reefer", "dry")
+        }
+        # order_id -> OrderFeat; order aggregates are fixed once the view is built
+        self._order_feat: Dict[str, OrderFeat] = {}
 
     # ------------------------ StateView protocol ------------------------ #
 
     def order_features(self, order_id: str) -> OrderFeat:
+        feat = self._order_feat.get(order_id)
+        if feat is not None:
+            return feat
+
         o = self._orders[order_id]
-        cust = self._customers.get(o.customer_id)
-        is_vip = bool(getattr(cust, "vip", False) if cust is not None else False)
+        is_vip = o.customer_id in self._vip_ids
 
-        return OrderFeat(
+        feat = OrderFeat(
             effective_volume_m3=float(o.effective_volume_m3),
             volume_m3=float(o.total_volume_m3),
             cold_volume_m3=float(o.cold_volume_m3),
@@ -72,31 +104,66 @@ class SimpleStateView(StateView):
             cold_fraction=float(o.cold_fraction),
             vip=is_vip
         )
+        self._order_feat[order_id] = feat
+        return feat
 
     def truck_features(self, truck_id: str) -> TruckFeat:
-        t = self._truck(truck_id)
-        kind = "reefer" if t.type == TruckType.REEFER else "dry"
-        return TruckFeat(type=kind)
+        feat = self._truck_feat.get(truck_id)
+        if feat is None:
+            feat = self._truck_feat[truck_id] = self._make_truck_feat(self._truck(truck_id))
+        return feat
+
+    def usable_capacities(self, truck_id: str) -> tuple[float, float, float]:
+        """(volume after reserve, cold, weight) capacities; residuals never exceed these."""
+        caps = self._usable_caps.get(truck_id)
+        if caps is None:
+            caps = self._usable_caps[truck_id] = self._make_usable_caps(self._truck(truck_id))
+        return caps
 
     def truck_residuals(self, truck_id: str) -> TruckResiduals:
         t = self._truck(truck_id)
-        # Use your Truck convenience residuals (honors reserve_fraction for volume)
+        vol_cap, cold_cap, wt_cap = self.usable_capacities(truck_id)
+        # same as Truck.residual_*() (reserve_fraction honored in vol_cap; DRY has no cold)
         return TruckResiduals(
-            remaining_volume_m3=float(t.residual_volume_m3()),
-            remaining_cold_m3=float(t.residual_cold_m3()),
-            remaining_weight_kg=float(t.residual_weight_kg()),
+            remaining_volume_m3=max(0.0, vol_cap - t.used_volume_m3),
+            remaining_cold_m3=max(0.0, cold_cap - t.used_cold_m3) if cold_cap else 0.0,
+            remaining_weight_kg=max(0.0, wt_cap - t.used_weight_kg),
         )
 
     def open_trucks(self, *, type_filter: Optional[str] = None) -> Iterable[str]:
         if type_filter is None:
             return list(self._open)
-        return [tid for tid in self._open if self._type_str(tid) == type_filter]
+        return list(self._open_by_type.get(type_filter, ()))
 
     def all_available_trucks(self, *, type_filter: Optional[str] = None) -> Iterable[str]:
-        ids = list(self._depot.available_trucks.keys())
+        ids = self._depot.available_truck_ids  # immutable tuple; safe to hand out
         if type_filter is None:
             return ids
-        return [tid for tid in ids if self._type_str(tid) == type_filter]
+        return self._all_by_type.get(type_filter, ())
+
+    def closed_trucks(self, *, type_filter: str) -> Sequence[str]:
+        """Available trucks of `type_filter` that are not open yet, in sorted id order."""
+        return tuple(self._closed_sorted.get(type_filter, ()))
+
+    def mark_open(self, truck_id: str) -> None:
+        """Record `truck_id` as open (deployed); keeps the per-type buckets in sync."""
+        kind = self._type_str(truck_id)
+        self._open.add(truck_id)
+        self._open_by_type[kind].add(truck_id)
+        closed = self._closed_sorted[kind]
+        i = bisect_left(closed, truck_id)
+        if i < len(closed) and closed[i] == truck_id:
+            del closed[i]
+
+    def mark_close(self, truck_id: str) -> None:
+        """
+        Drop a departed `truck_id` from the open set. It is not returned to the
+        closed pool either: a truck that has left cannot be opened again today.
+        """
+        if truck_id not in self._open:
+            return
+        self._open.discard(truck_id)
+        self._open_by_type[self._type_str(truck_id)].discard(truck_id)
 
     # ---------------------- Used by packing policy ---------------------- #
 
@@ -112,6 +179,21 @@ class SimpleStateView(StateView):
     def _truck(self, truck_id: str) -> Truck:
         return self._depot.get_truck(truck_id)
 
+    @staticmethod
+    def _make_truck_feat(t: Truck) -> TruckFeat:
+        kind = "reefer" if t.type == TruckType.REEFER else "dry"
+        return TruckFeat(
+            type=kind,
+            capacity_m3=float(t.total_capacity_m3),
+            cold_capacity_m3=float(t.cold_capacity_m3),
+            weight_limit_kg=float(t.weight_limit_kg),
+        )
+
+    @staticmethod
+    def _make_usable_caps(t: Truck) -> tuple[float, float, float]:
+        vol_cap = t.total_capacity_m3 * (1.0 - max(0.0, t.reserve_fraction))
+        cold_cap = 0.0 if t.type == TruckType.DRY else t.cold_capacity_m3
+        return float(vol_cap), float(cold_cap), float(t.weight_limit_kg)
+
     def _type_str(self, truck_id: str) -> str:
-        t = self._truck(truck_id)
-        return "reefer" if t.type == TruckType.REEFER else "dry"
+        return self.truck_features(truck_id).type
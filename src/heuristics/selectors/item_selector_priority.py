@@ -1,21 +1,60 @@
 # src/heuristics/selectors/item_selector_priority.py
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Sequence, Tuple, Literal
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Sequence, Tuple, Literal
 
 
 # ----------------------------- types -----------------------------
 
+# Per-line features carried on ItemRank (same columns as ItemRankRow, minus rank/sort_key)
+class ItemFeatures(NamedTuple):
+    cold01: float
+    w_ij: float
+    v_ij_eff: float
+    liquid01: float
+    stack_limit: float
+    fragile_score: float
+    upright01: float
+    sep_tag: str  # canonical: interned, lowercase (e.g. "hazardous", "food")
+
+
+@lru_cache(maxsize=None)
+def _canonical_sep_tag(tag: Any) -> str:
+    """Lowercase, interned form of a separation tag (a handful of distinct values)."""
+    return sys.intern(str(tag).lower())
+
+
+_FRAG_SCORE = {"regular": 0.0, "delicate": 1.0, "fragile": 2.0, "very_fragile": 2.0, "very fragile": 2.0}
+
+
+@lru_cache(maxsize=None)
+def _frag_score(fragility: Any) -> float:
+    """Fragility enum/str -> score (regular=0, delicate=1, fragile=2)."""
+    text = str(getattr(fragility, "value", fragility)).lower()
+    score = _FRAG_SCORE.get(text)
+    if score is not None:
+        return score
+    # free-form labels: fall back to keyword matching
+    if "fragile" in text:
+        return 2.0
+    if "delicate" in text:
+        return 1.0
+    return 0.0
+
+
 # Per-order, per-item ranked line used by placers (compatible with your StateView)
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ItemRank:
     item_id: str
     qty: int
-    features: Dict[str, float]  # e.g., {"cold01":1, "w_ij":..., "v_ij_eff":..., ...}
+    features: ItemFeatures  # e.g., features.cold01, features.w_ij, features.v_ij_eff, ...
 
 # Full audit row (with rank and sort_key) for CSV/debug
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ItemRankRow:
     rank: int
     item_id: str
@@ -44,6 +83,28 @@ RankDim = Literal[
 ]
 
 
+# Position of each rank dimension in a rank_items row
+# (item_id, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag,
+#  -cold01, -w_ij, -v_ij_eff, -liquid01, -stack_limit);
+# descending dims point at the pre-negated tail so every key column sorts ascending.
+_ROW_KEY_POS = {
+    "cold": 10, "weight": 11, "v_eff": 12, "liquid": 13,
+    "stack_limit": 14, "fragile": 7, "upright": 8, "item_id": 0,
+}
+
+
+@lru_cache(maxsize=None)  # keyed by the scheme tuple; sorters built in loops reuse the compiled key
+def _make_key_fn(scheme: Tuple[str, ...]) -> Callable[[Tuple], Tuple]:
+    """Map `scheme` (already validated) to a row -> lexicographic key tuple function."""
+    pos = [_ROW_KEY_POS[d] for d in scheme]
+    if len(pos) >= 2:
+        return itemgetter(*pos)  # C-level; returns a tuple for 2+ indices
+    if pos:
+        (i,) = pos
+        return lambda r: (r[i],)
+    return lambda r: ()
+
+
 class ItemLevelSorter:
     """
     Item-level priority sorter for a *single order*.
@@ -93,6 +154,8 @@ class ItemLevelSorter:
                 raise ValueError(f"Duplicate rank dimension '{d}' in scheme.")
             seen.add(d)
 
+        self._key_fn = _make_key_fn(self.scheme)
+
     # ----------------------------- API -----------------------------
 
     def rank_items(self, state: Any, order_id: str) -> List[ItemRank]:
@@ -101,85 +164,64 @@ class ItemLevelSorter:
         Returns ItemRank list (for placers) and stores full rows in `last_rank_rows` for audit.
         """
         feats = self._get_item_features(state, order_id)
-        rows_raw: List[Tuple[str, int, float, float, float, float, float, float, float]] = []
-        # tuple layout: (item_id, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag)
+        rows_raw: List[Tuple[str, int, float, float, float, float, float, float, float, str,
+                             float, float, float, float, float]] = []
+        # tuple layout: (item_id, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag,
+        #                -cold01, -w_ij, -v_ij_eff, -liquid01, -stack_limit)  # negated tail = sort columns
 
         for item, qty in feats:
-            iid = str(item.item_id)
             qty = int(qty)
 
-            # weights/volumes per line item
-            w_unit = float(item.unit_weight_kg)
-            v_unit = float(getattr(item, "effective_unit_volume", None)()  # type: ignore
-                           if hasattr(item, "effective_unit_volume")
-                           else item.unit_volume_m3 * (1.0 + float(item.padding_factor)))
-            v_nominal = float(item.unit_volume_m3)
+            (iid, w_unit, v_unit, v_nominal, cold, liquid01, stack_limit,
+             fragile_score, upright01, sep_tag) = self._item_statics(item)
 
+            # weights/volumes per line item
             w_ij = qty * w_unit
             v_ij_eff = qty * v_unit
-            cold01 = 1.0 if bool(item.category_cold) and v_nominal * qty > 0.0 else 0.0
+            cold01 = 1.0 if cold and v_nominal * qty > 0.0 else 0.0
 
-            # handling attributes
-            liquid01 = 1.0 if bool(item.is_liquid) else 0.0
-            stack_limit = float(item.max_stack_load_kg)
-            upright01 = 1.0 if bool(item.upright_only) else 0.0
+            rows_raw.append((iid, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag,
+                             -cold01, -w_ij, -v_ij_eff, -liquid01, -stack_limit))
 
-            # fragility score: regular=0, delicate=1, fragile=2
-            frag_text = str(getattr(item, "fragility", "regular")).lower()
-            if "fragile" in frag_text and "very" in frag_text:
-                fragile_score = 2.0
-            elif "fragile" in frag_text:
-                fragile_score = 2.0
-            elif "delicate" in frag_text:
-                fragile_score = 1.0
-            else:
-                fragile_score = 0.0
-            sep_tag = str(getattr(item, "separation_tag", "non_food")).lower()
-
-            rows_raw.append((iid, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag))
-
-        # build keys per scheme, then sort
-        keyed: List[Tuple[Tuple, Tuple]] = []
-        for r in rows_raw:
-            key = self._make_sort_key_tuple(r)
-            keyed.append((key, r))
-
-        keyed.sort(key=lambda x: x[0])
-
-        # produce outputs
+        # sort rows by the scheme key (list.sort decorates internally; stable)
+        key_fn = self._key_fn
+        rows_raw.sort(key=key_fn)
+
+        # produce outputs (row values are already typed: statics coerced once in _item_statics)
         self.last_rank_rows = []
         ranked: List[ItemRank] = []
-        for i, (key, (iid, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag)) in enumerate(keyed):
+        for i, row in enumerate(rows_raw):
+            (iid, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag) = row[:10]
             self.last_rank_rows.append(
                 ItemRankRow(
                     rank=i + 1,
                     item_id=iid,
                     qty=qty,
-                    cold01=float(cold01),
-                    w_ij=float(w_ij),
-                    v_ij_eff=float(v_ij_eff),
-                    liquid01=float(liquid01),
-                    stack_limit=float(stack_limit),
-                    fragile_score=float(fragile_score),
-                    upright01=float(upright01),
-                    sep_tag=str(sep_tag),
-                    sort_key=key,
+                    cold01=cold01,
+                    w_ij=w_ij,
+                    v_ij_eff=v_ij_eff,
+                    liquid01=liquid01,
+                    stack_limit=stack_limit,
+                    fragile_score=fragile_score,
+                    upright01=upright01,
+                    sep_tag=sep_tag,
+                    sort_key=key_fn(row),  # audit only; recomputed rather than kept through the sort
                 )
             )
             ranked.append(
                 ItemRank(
                     item_id=iid,
                     qty=qty,
-                    features={
-                        "cold01": float(cold01),
-                        "w_ij": float(w_ij),
-                        "v_ij_eff": float(v_ij_eff),
-                        "liquid01": float(liquid01),
-                        "stack_limit": float(stack_limit),
-                        "fragile_score": float(fragile_score),
-                        "upright01": float(upright01),
-                        "sep_tag": str(sep_tag)
-                    },
+                    features=ItemFeatures(
+                        cold01=cold01,
+                        w_ij=w_ij,
+                        v_ij_eff=v_ij_eff,
+                        liquid01=liquid01,
+                        stack_limit=stack_limit,
+                        fragile_score=fragile_score,
+                        upright01=upright01,
+                        sep_tag=sep_tag,
+                    ),
                 )
             )
 
@@ -195,27 +237,27 @@ class ItemLevelSorter:
         Map the configured `scheme` to a lexicographic tuple.
         Directions are fixed as documented in the class docstring.
         """
-        (iid, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sep_tag) = row
-
-        key_parts: List[object] = []
-        for dim in self.scheme:
-            if dim == "cold":
-                key_parts.append(-cold01)           # cold first
-            elif dim == "weight":
-                key_parts.append(-w_ij)             # heavier first
-            elif dim == "v_eff":
-                key_parts.append(-v_ij_eff)         # larger first
-            elif dim == "liquid":
-                key_parts.append(-liquid01)         # liquids earlier
-            elif dim == "stack_limit":
-                key_parts.append(-stack_limit)      # can bear more earlier
-            elif dim == "fragile":
-                key_parts.append(fragile_score)     # less fragile earlier
-            elif dim == "upright":
-                key_parts.append(upright01)         # non-upright earlier
-            elif dim == "item_id":
-                key_parts.append(iid)               # stable fallback
-        return tuple(key_parts)
+        return self._key_fn(row)
+
+    @staticmethod
+    def _item_statics(item: Any) -> Tuple:
+        """Order-independent per-Item values used by rank_items (see its row layout)."""
+        v_unit = float(getattr(item, "effective_unit_volume", None)()  # type: ignore
+                       if hasattr(item, "effective_unit_volume")
+                       else item.unit_volume_m3 * (1.0 + float(item.padding_factor)))
+        return (
+            str(item.item_id),
+            float(item.unit_weight_kg),
+            v_unit,
+            float(item.unit_volume_m3),
+            bool(item.category_cold),
+            1.0 if bool(item.is_liquid) else 0.0,
+            float(item.max_stack_load_kg),
+            # fragility score: regular=0, delicate=1, fragile=2
+            _frag_score(getattr(item, "fragility", "regular")),
+            1.0 if bool(item.upright_only) else 0.0,
+            _canonical_sep_tag(getattr(item, "separation_tag", "non_food")),
+        )
 
     @staticmethod
     def _get_item_features(state: Any, order_id: str) -> Iterable[Tuple[Any, int]]:
@@ -3,18 +3,43 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List, Tuple, Sequence, Literal
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, List, Tuple, Sequence, Literal
 
 
 # ---- configurable ranking dimensions (lexicographic, left→right) ----
 RankDim = Literal["vip", "due", "alpha", "v_eff", "weight", "order_id"]
 
-
-@dataclass
+# Row position of each rank dimension's sort column. Rows are
+#   (order_id, vip, due, alpha, v_eff, weight, -int(vip), due_key, -alpha, -v_eff, -weight);
+# descending dims point at the pre-negated tail so every key column sorts ascending.
+_ROW_KEY_POS = {
+    "vip": 6, "due": 7, "alpha": 8, "v_eff": 9, "weight": 10, "order_id": 0,
+}
+# Audit key reported in OrderRankRow.sort_key: same columns, but "due" stays the
+# datetime (due_key may be an int minute offset, which orders identically).
+_AUDIT_KEY_POS = {**_ROW_KEY_POS, "due": 2}
+
+
+@lru_cache(maxsize=None)  # keyed by the scheme tuple; selectors built in loops reuse the key getter
+def _make_key_fn(scheme: Tuple[str, ...], *, audit: bool = False) -> Callable[[Tuple], Tuple]:
+    """Map `scheme` (already validated) to a row -> lexicographic key tuple function."""
+    positions = _AUDIT_KEY_POS if audit else _ROW_KEY_POS
+    pos = [positions[d] for d in scheme]
+    if len(pos) >= 2:
+        return itemgetter(*pos)  # C-level; returns a tuple for 2+ indices
+    if pos:
+        (i,) = pos
+        return lambda r: (r[i],)
+    return lambda r: ()
+
+
+@dataclass(slots=True, frozen=True)
 class OrderRankRow:
     """
     A single line in the ranked order queue (for audit/CSV).
-    `sort_key` is the exact tuple used for lexicographic sorting.
+    `sort_key` is the lexicographic key the queue is sorted by, with due as a datetime.
     """
     rank: int
     order_id: str
@@ -33,7 +58,7 @@ class OrderLevelSelector:
 
     You control the priority with `scheme`, a sequence of RankDim:
         - "vip"      : VIP first (True before False)          ↓ (desc as -int(vip))
-        - "due"      : earlier due-time first                 ↑ (ascending datetime)
+        - "due"      : earlier due-time first                 ↑ (ascending due_min / datetime)
         - "alpha"    : higher cold fraction first             ↓
         - "v_eff"    : larger effective volume first          ↓
         - "weight"   : heavier first                          ↓
@@ -60,6 +85,9 @@ class OrderLevelSelector:
                 raise ValueError(f"Duplicate rank dimension '{d}' in scheme.")
             seen.add(d)
 
+        self._key_fn = _make_key_fn(self.scheme)
+        self._audit_key_fn = _make_key_fn(self.scheme, audit=True)
+
     # ------------------------- public API ------------------------- #
 
     def rank_orders(self, state: Any) -> List[OrderRankRow]:
@@ -71,11 +99,14 @@ class OrderLevelSelector:
           - order_features(order_id) -> object f with:
                 f.vip : bool
                 f.due_dt : datetime
+                f.due_min : int  (optional; sorts on it instead of due_dt when present)
                 f.cold_fraction : float
                 f.effective_volume_m3 : float
                 f.weight_kg : float
         """
-        order_ids = list(state.remaining_orders())
+        order_ids = state.remaining_orders()
+        if not isinstance(order_ids, (list, tuple)):  # SelectionState hands out a tuple snapshot
+            order_ids = list(order_ids)
         if not order_ids:
             self.last_rank = []
             return self.last_rank
@@ -94,53 +125,26 @@ class OrderLevelSelector:
             v_eff: float = float(f.effective_volume_m3)
             weight: float = float(f.weight_kg)
 
-            key = self._make_sort_key(oid, vip, due, alpha, v_eff, weight)
-            rows.append((oid, vip, due, alpha, v_eff, weight, key))
+            due_min = getattr(f, "due_min", None)
+            rows.append((
+                oid, vip, due, alpha, v_eff, weight,
+                -int(vip), due if due_min is None else due_min, -alpha, -v_eff, -weight,
+            ))
 
-        rows.sort(key=lambda r: r[-1])
+        rows.sort(key=self._key_fn)  # stable
+        audit_key = self._audit_key_fn
 
         self.last_rank = [
             OrderRankRow(
                 rank=i + 1,
-                order_id=oid,
-                vip=vip,
-                due=due.strftime("%H:%M"),
-                alpha=alpha,
-                v_eff=v_eff,
-                weight=weight,
-                sort_key=key,
+                order_id=row[0],
+                vip=row[1],
+                due=row[2].strftime("%H:%M"),
+                alpha=row[3],
+                v_eff=row[4],
+                weight=row[5],
+                sort_key=audit_key(row),
             )
-            for i, (oid, vip, due, alpha, v_eff, weight, key) in enumerate(rows)
+            for i, row in enumerate(rows)
         ]
         return self.last_rank
-
-    # ------------------------ internals -------------------------- #
-
-    def _make_sort_key(
-        self,
-        oid: str,
-        vip: bool,
-        due: datetime,
-        alpha: float,
-        v_eff: float,
-        weight: float,
-    ) -> Tuple:
-        """
-        Map the configured `scheme` to a lexicographic tuple.
-        Directions (fixed): vip↓, due↑, alpha↓, v_eff↓, weight↓, order_id↑
-        """
-        key_parts: List[object] = []
-        for dim in self.scheme:
-            if dim == "vip":
-                key_parts.append(-int(vip))        # True first
-            elif dim == "due":
-                key_parts.append(due)              # earlier first
-            elif dim == "alpha":
-                key_parts.append(-alpha)           # higher first
-            elif dim == "v_eff":
-                key_parts.append(-v_eff)           # larger first
-            elif dim == "weight":
-                key_parts.append(-weight)          # heavier first
-            elif dim == "order_id":
-                key_parts.append(oid)              # lexicographic
-        return tuple(key_parts)
@@ -2,17 +2,18 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Iterable, List, Tuple, Iterator
+from typing import Dict, Iterable, Tuple, Iterator
 
 from src.business_objects.customer_order import CustomerOrder
 from src.business_objects.customer import Customer
 from src.business_objects.item import Item
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _OrderFeatView:
     vip: bool
     due_dt: datetime
+    due_min: int  # minutes since day_start's midnight; cheap int sort key for due_dt
     cold_fraction: float
     effective_volume_m3: float
     weight_kg: float
@@ -26,7 +27,7 @@ class SelectionState:
       - remaining_orders() -> Iterable[str]
       - remove_order(order_id)        # optional convenience
       - order_features(order_id) -> object with fields:
-            vip, due_dt, cold_fraction, effective_volume_m3, weight_kg
+            vip, due_dt, due_min, cold_fraction, effective_volume_m3, weight_kg
       - item_features(order_id) -> Iterable[(Item, int)]
     """
 
@@ -40,36 +41,49 @@ class SelectionState:
     ) -> None:
         self._orders = orders
         self._customers = customers
+        # VIP membership precomputed once; order_features is called per ranking pass
+        self._vip_ids = frozenset(cid for cid, c in customers.items() if c.vip)
         self._items = items
-        self._remaining: List[str] = list(orders.keys())
+        self._day0 = day_start.replace(hour=0, minute=0, second=0, microsecond=0)
+        # insertion-ordered set (O(1) removal) + a tuple snapshot rebuilt only after changes
+        self._remaining: Dict[str, None] = dict.fromkeys(orders)
+        self._remaining_view: Tuple[str, ...] | None = None
 
         # ensure due_dt is bound (HH:MM -> today) for all orders
         for o in self._orders.values():
             if o.due_dt is None:
                 o.set_due_today(day_start)
 
+        # order_id -> _OrderFeatView; fields are fixed once due_dt is bound above
+        self._feat_cache: Dict[str, _OrderFeatView] = {}
+
     # ------------------- selector-facing API ------------------- #
 
     def remaining_orders(self) -> Iterable[str]:
-        # return a copy to keep it read-only for callers
-        return list(self._remaining)
+        # immutable snapshot keeps it read-only for callers; reused until the next removal
+        if self._remaining_view is None:
+            self._remaining_view = tuple(self._remaining)
+        return self._remaining_view
 
     def remove_order(self, order_id: str) -> None:
-        if order_id in self._remaining:
-            self._remaining.remove(order_id)
+        if self._remaining.pop(order_id, 0) is None:
+            self._remaining_view = None
 
     def order_features(self, order_id: str) -> _OrderFeatView:
-        o = self._orders[order_id]
-        c = self._customers.get(o.customer_id)
-        vip = bool(c.vip) if c is not None else False
+        v = self._feat_cache.get(order_id)
+        if v is not None:
+            return v
 
-        return _OrderFeatView(
-            vip=vip,
+        o = self._orders[order_id]
+        v = self._feat_cache[order_id] = _OrderFeatView(
+            vip=o.customer_id in self._vip_ids,
             due_dt=o.due_dt,  # set in __init__
+            due_min=int((o.due_dt - self._day0).total_seconds()) // 60,
             cold_fraction=float(o.cold_fraction),
             effective_volume_m3=float(o.effective_volume_m3),
             weight_kg=float(o.weight_kg),
         )
+        return v
 
     def item_features(self, order_id: str) -> Iterable[Tuple[Item, int]]:
         """
@@ -1,15 +1,26 @@
 # src/planning/placer_orchestrator.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Iterable, List, Optional, Sequence, Any, Literal, Callable
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, MutableMapping, Optional, Sequence, Tuple, Any, Literal, Callable
 import os
 import csv
+from operator import attrgetter, itemgetter
 
 from src.heuristics.placers.base import StateView, FeasibilityService, Policy, PackingPolicy, AssignOrder
 from src.heuristics.placers.best_fit_reefer import assign_to_best_reefer
 from src.heuristics.placers.best_fit_dry import assign_bucket_b_order, assign_bucket_c_order
+from src.heuristics.placers.state_view import OrderFeat
 from src.quality_metrics.tracker import DayTracker
 
+_ORDER_FEAT_GET = attrgetter("effective_volume_m3", "cold_volume_m3", "weight_kg", "volume_m3", "vip")
+_CSV_BUFFERING = 1 << 20  # one large buffer per report file instead of many small writes
+
+
+def _u_vol(t: Dict[str, Any]) -> float:
+    """Volume utilization U_vol from a DayTracker truck ledger (0 when Q is unset)."""
+    Q = float(t.get("Q", 0.0))
+    return 0.0 if Q <= 0 else float(t.get("used_v_eff", 0.0)) / Q
+
 
 def determine_bucket(alpha_i: float, *, alpha_threshold: float) -> str:
     """
@@ -40,6 +51,10 @@ class PlacerOrchestrator:
     reefer_scheme_B: Sequence[Literal] = ("cold", "volume", "weight")
     dry_scheme_B: Sequence[Literal] = ("volume", "weight")
     dry_scheme_C: Sequence[Literal] = ("volume", "weight")
+    fit_score: Literal["lex", "linf"] = "lex"  # how open trucks are ranked by leftover
+
+    # truck_id -> TruckFeat.type; truck types are static for the day
+    _truck_type_cache: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
 
     def run_one(self, order_id: str) -> Optional[AssignOrder]:
         """Route order to A/B/C placer and record outcome in DayTracker."""
@@ -53,6 +68,7 @@ class PlacerOrchestrator:
                 self.state, self.feas, self.policy, order_id,
                 packing_policy=self.packing,
                 ranking_scheme=self.reefer_scheme_A,
+                fit_score=self.fit_score,
             )
         elif bucket == "B":
             decision = assign_bucket_b_order(
@@ -60,16 +76,17 @@ class PlacerOrchestrator:
                 packing_policy=self.packing,
                 reefer_scheme=self.reefer_scheme_B,
                 dry_scheme=self.dry_scheme_B,
+                fit_score=self.fit_score,
             )
         else:  # "C"
             decision = assign_bucket_c_order(
                 self.state, self.feas, self.policy, order_id,
                 packing_policy=self.packing,
                 dry_scheme=self.dry_scheme_C,
+                fit_score=self.fit_score,
             )
 
         # Record outcome
-        is_vip = bool(getattr(f, "vip", False))
         if decision is not None:
 
             self.apply_decision(
@@ -78,7 +95,7 @@ class PlacerOrchestrator:
             )
         else:
             self.tracker.on_failure(
-                order_id, is_vip=is_vip,
+                order_id, is_vip=bool(getattr(f, "vip", False)),
                 due_missed=False, delay_min=None,
                 reason=f"infeasible_in_bucket_{bucket}"
             )
@@ -95,6 +112,26 @@ class PlacerOrchestrator:
             decisions.append(self.run_one(oid))
         return decisions
 
+    def run_stream(
+            self,
+            ranked: Iterable[Tuple[str, Sequence[Any]]],
+            *,
+            sorted_items: Optional[MutableMapping[str, Sequence[Any]]] = None,
+    ) -> List[Optional[AssignOrder]]:
+        """
+        Place orders as Phase 1 produces them, e.g. from
+        SelectionOrchestrator.iter_ranked(): each `(order_id, ranked_items)` pair is
+        placed before the next one is pulled. Pass the mapping your StateView reads
+        sorted items from as `sorted_items` so each order's items are published first.
+        Returns decisions in arrival order.
+        """
+        decisions: List[Optional[AssignOrder]] = []
+        for oid, items in ranked:
+            if sorted_items is not None:
+                sorted_items[oid] = items
+            decisions.append(self.run_one(oid))
+        return decisions
+
     def run_loop(
             self,
             selector: Any,
@@ -177,21 +214,34 @@ class PlacerOrchestrator:
         This ensures subsequent feasibility checks see updated residuals.
         """
         # Feature view (demand) for tracker and fallback mutations
-        f = features or self.state.order_features(decision.order_id)
+        f = features if features is not None else self.state.order_features(decision.order_id)
 
         # 0) make sure tracker knows this truck is opened
         self._ensure_tracker_truck_open(decision.truck_id)
 
-        if hasattr(self.state, "_open"):
+        truck_type = self._truck_type_cache.get(decision.truck_id)
+        if truck_type is None:
+            truck_type = getattr(self.state.truck_features(decision.truck_id), "type", "")
+            self._truck_type_cache[decision.truck_id] = truck_type
+        is_dry = (truck_type == "dry")
+
+        if hasattr(self.state, "mark_open"):
+            self.state.mark_open(decision.truck_id)
+        elif hasattr(self.state, "_open"):
             try:
                 self.state._open.add(decision.truck_id)
             except Exception:
                 pass
 
-        v_eff = float(getattr(f, "effective_volume_m3", 0.0))
-        q_cold = float(getattr(f, "cold_volume_m3", 0.0))
-        w = float(getattr(f, "weight_kg", 0.0))
-        q = float(getattr(f, "volume_m3", 0.0))
+        if isinstance(f, OrderFeat):
+            # typed fast path: slotted fields, already floats; one C-level fetch
+            v_eff, q_cold, w, q, is_vip = _ORDER_FEAT_GET(f)
+        else:
+            v_eff = float(getattr(f, "effective_volume_m3", 0.0))
+            q_cold = float(getattr(f, "cold_volume_m3", 0.0))
+            w = float(getattr(f, "weight_kg", 0.0))
+            q = float(getattr(f, "volume_m3", 0.0))
+            is_vip = bool(getattr(f, "vip", False))
 
         # 1) Mutate concrete state if caller provided a hook
         if self.commit_hook is not None:
@@ -216,12 +266,12 @@ class PlacerOrchestrator:
                     pass
 
             # 2) Book portable-cooler usage in DayTracker when cold goes onto a DRY truck
-            is_dry = (getattr(self.state.truck_features(decision.truck_id), "type", "") == "dry")
             if is_dry and q_cold > 0.0:
                 # ensure ledger exists then increment
-                trk = self.tracker.trucks.get(decision.truck_id, {})
+                trucks = self.tracker.trucks
+                trk = trucks.get(decision.truck_id, {})
                 trk["cooler_used_m3"] = float(trk.get("cooler_used_m3", 0.0)) + q_cold
-                self.tracker.trucks[decision.truck_id] = trk
+                trucks[decision.truck_id] = trk
 
         # 3) Update DayTracker (VIP / due-met not modeled yet; pass None)
         self.tracker.on_assign(
@@ -231,10 +281,10 @@ class PlacerOrchestrator:
             q_cold=q_cold,
             w=w,
             v_eff=v_eff,
-            is_vip=bool(getattr(f, "vip", False)),
+            is_vip=is_vip,
             due_met=None,
             delay_min=None,
-            cold_on_dry=(q_cold > 0 and getattr(self.state.truck_features(decision.truck_id), "type", "") == "dry"),
+            cold_on_dry=(q_cold > 0 and is_dry),
         )
 
         # If packing plan includes placements, log them for CSV
@@ -260,6 +310,9 @@ class PlacerOrchestrator:
         - "min_util": depart trucks whose U_vol ≥ τ_min + min_util_slack.
         - "time": depart all currently opened trucks and stamp a provided `depart_time` (HH:MM).
 
+        Departed trucks are also dropped from the state's open set (state.mark_close,
+        when the view has it), so later placements no longer consider them.
+
         Returns the list of truck_ids that were just marked departed.
         """
         departed: List[str] = []
@@ -267,23 +320,31 @@ class PlacerOrchestrator:
             return departed
 
         # We use DayTracker's ledger (since it knows τ_min and used loads).
-        for tid, t in getattr(self.tracker, "trucks", {}).items():
-            if t.get("departed", False) or not t.get("opened", False):
-                continue
-
-            if strategy == "min_util":
-                Q = float(t.get("Q", 0.0))
-                used_v = float(t.get("used_v_eff", 0.0))
-                tau_min = float(t.get("tau_min", 0.0))
-                u = 0.0 if Q <= 0 else (used_v / Q)
-                if u + 1e-9 >= tau_min + float(min_util_slack):
-                    self.tracker.on_departure(tid, when=None)
-                    departed.append(tid)
-
-            elif strategy == "time":
-                self.tracker.on_departure(tid, when=depart_time)
-                departed.append(tid)
+        # Pick the departing ids in one pass over a snapshot, then depart them.
+        trucks = getattr(self.tracker, "trucks", {})
+        if strategy == "min_util":
+            slack = float(min_util_slack)
+            departed = [
+                tid for tid, t in trucks.items()
+                if t.get("opened", False) and not t.get("departed", False)
+                and _u_vol(t) + 1e-9 >= float(t.get("tau_min", 0.0)) + slack
+            ]
+            when = None
+        elif strategy == "time":
+            departed = [
+                tid for tid, t in trucks.items()
+                if t.get("opened", False) and not t.get("departed", False)
+            ]
+            when = depart_time
+        else:
+            return departed
 
+        on_departure = self.tracker.on_departure
+        mark_close = getattr(self.state, "mark_close", None)
+        for tid in departed:
+            on_departure(tid, when=when)
+            if mark_close is not None:
+                mark_close(tid)  # departed trucks take no further orders
         return departed
 
     def finalize_day(self) -> dict:
@@ -307,12 +368,11 @@ class PlacerOrchestrator:
         per_truck_fp = os.path.join(dirpath, "per_truck.csv")
         per_truck_rows = snapshot.get("per_truck", [])
         if per_truck_rows:
-            headers = list(per_truck_rows[0].keys())
-            with open(per_truck_fp, "w", newline="") as f:
-                w = csv.DictWriter(f, fieldnames=headers)
-                w.writeheader()
-                for row in per_truck_rows:
-                    w.writerow(row)
+            headers = list(per_truck_rows[0].keys())  # summarize_day builds every row with the same keys
+            with open(per_truck_fp, "w", newline="", buffering=_CSV_BUFFERING) as f:
+                w = csv.writer(f)
+                w.writerow(headers)
+                w.writerows(map(itemgetter(*headers), per_truck_rows))
         else:
             with open(per_truck_fp, "w", newline="") as f:
                 f.write("")
@@ -322,10 +382,10 @@ class PlacerOrchestrator:
         fleet_row = snapshot.get("fleet", {})
         if fleet_row:
             headers = list(fleet_row.keys())
-            with open(fleet_fp, "w", newline="") as f:
-                w = csv.DictWriter(f, fieldnames=headers)
-                w.writeheader()
-                w.writerow(fleet_row)
+            with open(fleet_fp, "w", newline="", buffering=_CSV_BUFFERING) as f:
+                w = csv.writer(f)
+                w.writerow(headers)
+                w.writerow(fleet_row.values())
         else:
             with open(fleet_fp, "w", newline="") as f:
                 f.write("")
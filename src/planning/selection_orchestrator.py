@@ -1,14 +1,17 @@
 # src/planning/selection_orchestrator.py
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import os
 import csv
+from operator import itemgetter
 
 from src.heuristics.selectors.order_selector_vip_due import OrderLevelSelector
 from src.heuristics.selectors.item_selector_priority import ItemLevelSorter
 from src.quality_metrics.tracker import DayTracker
 
+_CSV_BUFFERING = 1 << 20  # one large buffer per report file instead of many small writes
+
 
 @dataclass
 class SelectionOrchestrator:
@@ -36,6 +39,17 @@ class SelectionOrchestrator:
         Returns:
             Ordered list of order_ids (your Phase-1 queue).
         """
+        return [order_id for order_id, _ in self.iter_ranked(run_id=run_id, reset_logs=reset_logs)]
+
+    def iter_ranked(
+            self, *, run_id: Optional[str] = None, reset_logs: bool = True
+    ) -> Iterator[Tuple[str, list]]:
+        """
+        Generator form of `run()`: ranks and logs the order queue up front, then ranks
+        items order by order and yields `(order_id, ranked_items)` as soon as each
+        order's items are logged. Lets Phase 2 start placing before Phase 1 has
+        ranked every order (see PlacerOrchestrator.run_stream).
+        """
         # ---- 1) Order ranking ----
         ranked_orders = self.order_selector.rank_orders(self.state)
 
@@ -56,33 +70,21 @@ class SelectionOrchestrator:
         sorter_name = getattr(self.item_sorter, "name", "item_sorter")
         item_scheme = list(getattr(self.item_sorter, "scheme", ()))  # e.g., ["cold01","w_ij","v_ij_eff",...]
 
-        ordered_ids: List[str] = []
-        ranked_items_by_order: Dict[str, list] = {}
+        # Stash results for Phase-2 (filled as orders are yielded)
+        self._order_queue_ids = []
+        self._ranked_items_by_order = {}
 
         for row in ranked_orders:
             order_id = row.order_id
-            ordered_ids.append(order_id)
 
             ranked_items = self.item_sorter.rank_items(self.state, order_id)
-            ranked_items_by_order[order_id] = ranked_items
-
-            item_rows = []
-            for idx, ir in enumerate(ranked_items, start=1):
-                f = ir.features or {}
-                item_rows.append({
-                    "rank": idx,
-                    "item_id": ir.item_id,
-                    "qty": int(ir.qty),
-                    "cold01": float(f.get("cold01", 0.0)),
-                    "w_ij": float(f.get("w_ij", 0.0)),
-                    "v_ij_eff": float(f.get("v_ij_eff", 0.0)),
-                    "liquid01": float(f.get("liquid01", 0.0)),
-                    "stack_limit": float(f.get("stack_limit", 0.0)),
-                    "fragile_score": float(f.get("fragile_score", 0.0)),
-                    "upright01": float(f.get("upright01", 0.0)),
-                    "sep_tag": str(f.get("sep_tag", "Non-Food")),
-                    "sort_key": "",  # optional; fill if your sorter exposes it
-                })
+
+            # plain tuples in tracker.ITEM_QUEUE_FIELDS order; ItemFeatures already
+            # holds cold01..sep_tag in that order. sort_key is optional; fill if your sorter exposes it
+            item_rows = [
+                (idx, ir.item_id, int(ir.qty), *ir.features, "")
+                for idx, ir in enumerate(ranked_items, start=1)
+            ]
 
             self.tracker.record_item_queue(
                 order_id,
@@ -93,11 +95,9 @@ class SelectionOrchestrator:
                 reset=False,
             )
 
-        # Stash results for Phase-2
-        self._order_queue_ids = ordered_ids
-        self._ranked_items_by_order = ranked_items_by_order
-
-        return ordered_ids
+            self._order_queue_ids.append(order_id)
+            self._ranked_items_by_order[order_id] = ranked_items
+            yield order_id, ranked_items
 
         # ---------- getters for Phase-2 ----------
 
@@ -130,10 +130,10 @@ class SelectionOrchestrator:
         order_fp = os.path.join(dirpath, "order_queue.csv")
         if order_rows:
             headers = list(order_rows[0].keys())
-            with open(order_fp, "w", newline="") as f:
-                w = csv.DictWriter(f, fieldnames=headers)
-                w.writeheader()
-                w.writerows(order_rows)
+            with open(order_fp, "w", newline="", buffering=_CSV_BUFFERING) as f:
+                w = csv.writer(f)
+                w.writerow(headers)
+                w.writerows(map(itemgetter(*headers), order_rows))
         else:
             # create an empty file for consistency
             with open(order_fp, "w", newline="") as f:
@@ -144,10 +144,10 @@ class SelectionOrchestrator:
         item_fp = os.path.join(dirpath, "item_rankings.csv")
         if item_rows:
             headers = list(item_rows[0].keys())
-            with open(item_fp, "w", newline="") as f:
-                w = csv.DictWriter(f, fieldnames=headers)
-                w.writeheader()
-                w.writerows(item_rows)
+            with open(item_fp, "w", newline="", buffering=_CSV_BUFFERING) as f:
+                w = csv.writer(f)
+                w.writerow(headers)
+                w.writerows(map(itemgetter(*headers), item_rows))
         else:
             with open(item_fp, "w", newline="") as f:
                 f.write("")
@@ -272,7 +272,7 @@ def under_min_count(uvol_list: Iterable[float], tau_min_list: Iterable[float]) -
     Notation:
         V_{util}^{min} = # { k : y_k = 1 ∧ U_k^{vol} < τ^{min} }
     """
-    return sum(int(u + EPS < t) for u, t in zip(uvol_list, tau_min_list))
+    return sum(1 for u, t in zip(uvol_list, tau_min_list) if u + EPS < t)
 
 
 def cap_violations_count(truck_measures: Iterable[Tuple[float, float, float, float, float, float]]) -> int:
@@ -2,6 +2,7 @@
 from __future__ import annotations
 import os
 import csv
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional, Dict, Set, Tuple, Iterable, Any, Sequence
 from datetime import datetime
@@ -15,6 +16,12 @@ from src.quality_metrics.kpis import (
     avg_u_vol, avg_u_w, avg_u_cold, avg_u_bn, cv_u_w, cv_u_bn
 )
 
+# Positional layout of plain-tuple rows accepted by DayTracker.record_item_queue
+ITEM_QUEUE_FIELDS = (
+    "rank", "item_id", "qty", "cold01", "w_ij", "v_ij_eff", "liquid01",
+    "stack_limit", "fragile_score", "upright01", "sep_tag", "sort_key",
+)
+
 
 class DayTracker:
     """
@@ -336,6 +343,7 @@ class DayTracker:
 
         ranked_rows: iterable with fields:
           rank, item_id, qty, cold01, w_ij, v_ij_eff, liquid01, stack_limit, fragile_score, upright01, sort_key
+          Plain tuples are read positionally in ITEM_QUEUE_FIELDS order.
         sorter_name: e.g. "item_priority"
         item_scheme: e.g. ("cold01","w_ij","v_ij_eff","liquid01","stack_limit","fragile_score↑","upright01↑")
         run_id: optional tag to correlate with order queue runs
@@ -355,10 +363,13 @@ class DayTracker:
             return r[k] if isinstance(r, dict) and k in r else getattr(r, k, default)
 
         out = self.item_queue_log[order_id]
+        order_id = str(order_id)
         for r in ranked_rows:
+            if type(r) is tuple:
+                r = dict(zip(ITEM_QUEUE_FIELDS, r))
             out.append({
                 "run_id": run_id,
-                "order_id": str(order_id),
+                "order_id": order_id,
                 "rank": int(_get(r, "rank", 0)),
                 "item_id": str(_get(r, "item_id", "")),
                 "qty": int(_get(r, "qty", 0)),
@@ -598,10 +609,9 @@ class DayTracker:
             return filepath
         headers = list(rows[0].keys())
         with open(filepath, "w", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=headers)
-            w.writeheader()
-            for r in rows:
-                w.writerow(r)
+            w = csv.writer(f)
+            w.writerow(headers)
+            w.writerows(map(itemgetter(*headers), rows))
         return filepath
 
     def export_order_queue_csv(self, path: str | Path) -> None:
@@ -645,25 +655,26 @@ class DayTracker:
             w.writerows(all_rows)
 
     def export_order_status_csv(self, filepath):
-        import csv, os
         os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-        rows = []
-        for oid, rec in self.orders.items():
-            rows.append({
-                "order_id": oid,
-                "placed": bool(rec.get("placed", False)),
-                "assigned_truck_count": int(rec.get("assigned_truck_count", 0)),
-                "reason": rec.get("reason"),
-                "is_vip": bool(rec.get("is_vip", False)),
-                "due_met": rec.get("due_met"),
-                "delay_min": rec.get("delay_min"),
-            })
-        if not rows:
+        if not self.orders:
             open(filepath, "w").close();
             return filepath
+        headers = ("order_id", "placed", "assigned_truck_count", "reason", "is_vip", "due_met", "delay_min")
+        rows = (
+            (
+                oid,
+                bool(rec.get("placed", False)),
+                int(rec.get("assigned_truck_count", 0)),
+                rec.get("reason"),
+                bool(rec.get("is_vip", False)),
+                rec.get("due_met"),
+                rec.get("delay_min"),
+            )
+            for oid, rec in self.orders.items()
+        )
         with open(filepath, "w", newline="") as f:
-            w = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
-            w.writeheader();
+            w = csv.writer(f)
+            w.writerow(headers)
             w.writerows(rows)
         return filepath
 
@@ -0,0 +1,151 @@
+# tests/fit_scoring_test.py
+"""
+Here’s what each scenario tests:
+
+   Case 1 - linf picks a different reefer than lex:
+   R1 has the tightest cold leftover but lots of spare volume; R2 is moderately
+   full in every dimension. The default lexicographic score (cold first) picks R1,
+   while fit_score="linf" ranks by the largest normalized leftover and picks R2.
+
+   Case 2 - linf picks a different dry truck than lex:
+   Same idea on DRY trucks with the (volume, weight) scheme.
+
+   Case 3 - score helpers:
+   linf_score normalizes each leftover by the truck's capacity and keeps the
+   largest; is_perfect_fit accepts both lex tuples and linf floats.
+"""
+from __future__ import annotations
+
+# --- business objects ---
+from src.business_objects.common import Dimensions, Fragility, SeparationTag, TruckType
+from src.business_objects.item import Item
+from src.business_objects.customer_order import CustomerOrder
+from src.business_objects.truck import Truck
+from src.business_objects.depot import Depot
+
+# --- placers ---
+from src.heuristics.placers.state_view import SimpleStateView
+from src.heuristics.placers.feasibility import SimpleFeasibility
+from src.heuristics.placers.policy import SimplePolicy
+from src.heuristics.placers.fit_scoring import linf_score, is_perfect_fit
+
+# --- the functions under test ---
+from src.heuristics.placers.best_fit_reefer import choose_best_open_reefer
+from src.heuristics.placers.best_fit_dry import choose_best_open_dry
+
+
+# ───────────────────────────────── helpers to build a tiny world ───────────────────────────────── #
+
+def build_catalog() -> dict:
+    return {
+        "I_MILK": Item(
+            item_id="I_MILK", name="Milk",
+            category_cold=True, unit_weight_kg=1.05, unit_volume_m3=0.0021,
+            dims_m=Dimensions(0.08, 0.08, 0.22),
+            fragility=Fragility.DELICATE, max_stack_load_kg=5,
+            is_liquid=True, upright_only=True, separation_tag=SeparationTag.FOOD,
+        ),
+        "I_WATER": Item(
+            item_id="I_WATER", name="Bottled Water",
+            category_cold=False, unit_weight_kg=9.6, unit_volume_m3=0.022,
+            dims_m=Dimensions(0.25, 0.25, 0.35),
+            fragility=Fragility.REGULAR, max_stack_load_kg=150,
+            is_liquid=True, upright_only=False, separation_tag=SeparationTag.FOOD,
+        ),
+    }
+
+
+def build_orders(items: dict) -> dict:
+    o_cold = CustomerOrder.from_items(
+        order_id="O_COLD", customer_id="C1",
+        item_list={"I_MILK": 100},
+        due_time_str="11:00", items=items,
+    )
+    o_dry = CustomerOrder.from_items(
+        order_id="O_DRY", customer_id="C2",
+        item_list={"I_WATER": 10},
+        due_time_str="12:00", items=items,
+    )
+    return {"O_COLD": o_cold, "O_DRY": o_dry}
+
+
+def build_state(trucks: dict, open_ids: list) -> SimpleStateView:
+    items = build_catalog()
+    depot = Depot(depot_id="D001", location="TestCity", available_trucks=trucks)
+    return SimpleStateView(
+        depot=depot, orders=build_orders(items), open_truck_ids=open_ids,
+        sorted_items_provider={}, customers={},
+    )
+
+
+def preset_used(truck: Truck, *, volume=0.0, cold=0.0, weight=0.0) -> None:
+    truck.used_volume_m3 = float(volume)
+    truck.used_cold_m3 = float(cold)
+    truck.used_weight_kg = float(weight)
+
+
+# ───────────────────────────────── scenarios ───────────────────────────────── #
+
+def case_1_linf_reorders_reefers():
+    r1 = Truck(truck_id="R1", type=TruckType.REEFER,
+               total_capacity_m3=24.0, cold_capacity_m3=12.0,
+               weight_limit_kg=9500, fixed_cost=500, min_utilization=0.60, reserve_fraction=0.06)
+    r2 = Truck(truck_id="R2", type=TruckType.REEFER,
+               total_capacity_m3=28.0, cold_capacity_m3=14.0,
+               weight_limit_kg=10500, fixed_cost=560, min_utilization=0.60, reserve_fraction=0.06)
+    preset_used(r1, volume=1.0, cold=11.5, weight=8500)   # tight cold, almost empty volume
+    preset_used(r2, volume=22.0, cold=10.0, weight=9500)  # moderately full everywhere
+
+    state = build_state({"R1": r1, "R2": r2}, ["R1", "R2"])
+    feas, policy = SimpleFeasibility(), SimplePolicy()
+
+    lex = choose_best_open_reefer(state, feas, policy, "O_COLD")
+    linf = choose_best_open_reefer(state, feas, policy, "O_COLD", fit_score="linf")
+    print("[case 1] lex →", lex, "| linf →", linf)
+    assert lex == "R1"
+    assert linf == "R2"
+
+
+def case_2_linf_reorders_dry_trucks():
+    d1 = Truck(truck_id="D1", type=TruckType.DRY,
+               total_capacity_m3=26.0, cold_capacity_m3=0.0,
+               weight_limit_kg=10000, fixed_cost=460, min_utilization=0.75, reserve_fraction=0.05)
+    d2 = Truck(truck_id="D2", type=TruckType.DRY,
+               total_capacity_m3=26.0, cold_capacity_m3=0.0,
+               weight_limit_kg=10000, fixed_cost=460, min_utilization=0.75, reserve_fraction=0.05)
+    preset_used(d1, volume=24.0, weight=0.0)     # tight volume, weight untouched
+    preset_used(d2, volume=20.0, weight=9500.0)  # moderately full in both
+
+    state = build_state({"D1": d1, "D2": d2}, ["D1", "D2"])
+    feas, policy = SimpleFeasibility(), SimplePolicy()
+
+    lex = choose_best_open_dry(state, feas, policy, "O_DRY")
+    linf = choose_best_open_dry(state, feas, policy, "O_DRY", fit_score="linf")
+    print("[case 2] lex →", lex, "| linf →", linf)
+    assert lex == "D1"
+    assert linf == "D2"
+
+
+def case_3_score_helpers():
+    r1 = Truck(truck_id="R1", type=TruckType.REEFER,
+               total_capacity_m3=20.0, cold_capacity_m3=10.0,
+               weight_limit_kg=1000, fixed_cost=500, min_utilization=0.60, reserve_fraction=0.0)
+    state = build_state({"R1": r1}, ["R1"])
+
+    # cold 2/10, volume 1/20, weight 100/1000 → largest normalized leftover is cold
+    score = linf_score(state=state, truck_id="R1",
+                       scheme=("cold", "volume", "weight"), leftover=(2.0, 1.0, 100.0))
+    print("[case 3] linf_score →", score)
+    assert abs(score - 0.2) < 1e-12
+
+    assert is_perfect_fit((0.0, 0.0, 0.0))
+    assert not is_perfect_fit((0.0, 0.5))
+    assert is_perfect_fit(0.0)
+    assert not is_perfect_fit(0.1)
+
+
+if __name__ == "__main__":
+    print("=== fit_scoring tests ===")
+    case_1_linf_reorders_reefers()
+    case_2_linf_reorders_dry_trucks()
+    case_3_score_helpers()
@@ -0,0 +1,120 @@
+# tests/load_instance_test.py
+"""
+Here’s what each scenario tests (on a scratch copy of problems/problem_1):
+
+   Case 1 - caching is opt-in:
+   A default load writes nothing, neither into the input directory nor into the
+   cache directory.
+
+   Case 2 - cache hit:
+   use_cache=True writes one entry into cache_dir and nothing into the input
+   directory; the next load is served from that entry and matches a fresh build.
+
+   Case 3 - cache invalidation:
+   Editing an input JSON changes the key; the reload reflects the edit and the old
+   entry is replaced, still only inside cache_dir.
+"""
+from __future__ import annotations
+import json
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+
+from scripts.utils import load_instance
+
+PROBLEM_DIR = Path(__file__).resolve().parents[1] / "problems" / "problem_1"
+
+
+# ───────────────────────────────── helpers ───────────────────────────────── #
+
+def copy_problem(tmp: Path) -> Path:
+    base = tmp / "problem"
+    shutil.copytree(PROBLEM_DIR, base)
+    return base
+
+
+def listing(path: Path) -> list:
+    return sorted(p.name for p in path.iterdir()) if path.exists() else []
+
+
+def fingerprint(instance) -> tuple:
+    """Comparable summary of a loaded (depot, orders, customers, items) tuple."""
+    depot, orders, customers, items = instance
+    return (
+        depot.depot_id,
+        tuple(depot.available_truck_ids),
+        tuple((oid, o.customer_id, tuple(sorted(o.item_list.items())), o.due_time_str,
+               round(o.effective_volume_m3, 9), round(o.weight_kg, 9))
+              for oid, o in orders.items()),
+        tuple(sorted(customers)),
+        tuple(sorted(items)),
+    )
+
+
+# ───────────────────────────────── scenarios ───────────────────────────────── #
+
+def case_1_default_load_writes_nothing():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        base = copy_problem(tmp)
+        before = listing(base)
+
+        load_instance(str(base), cache_dir=tmp / "cache")
+
+        print("[case 1] input dir after default load:", listing(base))
+        assert listing(base) == before
+        assert not (tmp / "cache").exists()
+
+
+def case_2_cache_hit_lives_in_cache_dir():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        base = copy_problem(tmp)
+        cache = tmp / "cache"
+        before = listing(base)
+
+        fresh = load_instance(str(base))
+        first = load_instance(str(base), use_cache=True, cache_dir=cache)
+        entries = list(cache.glob("*.pkl"))
+        print("[case 2] cache entries:", [p.name for p in entries])
+        assert len(entries) == 1
+        assert listing(base) == before
+        assert fingerprint(first) == fingerprint(fresh)
+
+        second = load_instance(str(base), use_cache=True, cache_dir=cache)
+        assert fingerprint(second) == fingerprint(fresh)
+
+        # prove the second load is served from the entry rather than rebuilt
+        entries[0].write_bytes(pickle.dumps("from-cache"))
+        assert load_instance(str(base), use_cache=True, cache_dir=cache) == "from-cache"
+
+
+def case_3_edit_invalidates_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        base = copy_problem(tmp)
+        cache = tmp / "cache"
+
+        load_instance(str(base), use_cache=True, cache_dir=cache)
+        (old,) = cache.glob("*.pkl")
+
+        orders_path = base / "orders.json"
+        raw = json.loads(orders_path.read_text(encoding="utf-8"))
+        raw[0]["due_time_str"] = "06:15"
+        orders_path.write_text(json.dumps(raw), encoding="utf-8")
+        before = listing(base)
+
+        _, orders, _, _ = load_instance(str(base), use_cache=True, cache_dir=cache)
+        entries = list(cache.glob("*.pkl"))
+        print("[case 3] entries after edit:", [p.name for p in entries])
+        assert orders[raw[0]["order_id"]].due_time_str == "06:15"
+        assert len(entries) == 1 and entries[0] != old
+        assert listing(base) == before
+
+
+if __name__ == "__main__":
+    print("=== load_instance tests ===")
+    case_1_default_load_writes_nothing()
+    case_2_cache_hit_lives_in_cache_dir()
+    case_3_edit_invalidates_entry()
@@ -0,0 +1,130 @@
+# tests/placer_orchestrator_test.py
+"""
+Here’s what each scenario tests:
+
+   Case 1 - run_stream matches the batch pipeline:
+   On problems/problem_1, feeding SelectionOrchestrator.iter_ranked() into
+   PlacerOrchestrator.run_stream() yields the same decisions, in the same order,
+   as ranking everything first and calling run_many() on the queue.
+
+   Case 2 - run_stream publishes items before placing:
+   Each order's ranked items are written into the `sorted_items` mapping before
+   that order is placed, and packing reads exactly the list Phase 1 yielded.
+"""
+from __future__ import annotations
+from datetime import datetime
+from pathlib import Path
+
+from scripts.utils import load_instance, build_sorted_items_map_from_logs
+from src.heuristics.selectors.order_selector_vip_due import OrderLevelSelector
+from src.heuristics.selectors.item_selector_priority import ItemLevelSorter
+from src.heuristics.selectors.select_state import SelectionState
+from src.heuristics.placers.packing import SimplePackingPolicy
+from src.heuristics.placers.feasibility import SimpleFeasibility
+from src.heuristics.placers.policy import SimplePolicy
+from src.heuristics.placers.state_view import SimpleStateView
+from src.planning.selection_orchestrator import SelectionOrchestrator
+from src.planning.placer_orchestrator import PlacerOrchestrator
+from src.quality_metrics.tracker import DayTracker
+
+PROBLEM_DIR = Path(__file__).resolve().parents[1] / "problems" / "problem_1"
+
+
+# ───────────────────────────────── helpers ───────────────────────────────── #
+
+def build_pipeline(sorted_items: dict):
+    """Fresh instance + Phase-1 and Phase-2 orchestrators sharing one tracker."""
+    depot, orders, customers, items = load_instance(str(PROBLEM_DIR))
+    today0 = datetime(2025, 1, 1)
+    for o in orders.values():
+        o.set_due_today(today0)
+
+    tracker = DayTracker()
+    sel = SelectionOrchestrator(
+        state=SelectionState(orders=orders, customers=customers, items=items, day_start=today0),
+        tracker=tracker,
+        order_selector=OrderLevelSelector(scheme=("vip", "due", "alpha", "v_eff")),
+        item_sorter=ItemLevelSorter(scheme=("cold", "weight", "v_eff", "liquid",
+                                            "stack_limit", "fragile", "upright")),
+    )
+    state = SimpleStateView(
+        depot=depot, orders=orders, open_truck_ids=[],
+        sorted_items_provider=sorted_items, customers=customers,
+    )
+    placer = PlacerOrchestrator(
+        state=state,
+        feas=SimpleFeasibility(),
+        policy=SimplePolicy(allow_cold_in_dry_B=True, per_truck_cooler_m3=1.5),
+        packing=SimplePackingPolicy(),
+        tracker=tracker,
+    )
+    return sel, placer, tracker
+
+
+def summarize(decisions) -> list:
+    return [None if d is None else (d.order_id, d.truck_id) for d in decisions]
+
+
+# ───────────────────────────────── scenarios ───────────────────────────────── #
+
+def case_1_run_stream_matches_run_many():
+    # batch: rank everything, rebuild the items map from logs, then place
+    batch_items: dict = {}
+    sel, placer, tracker = build_pipeline(batch_items)
+    queue = sel.run(run_id="batch")
+    batch_items.update(build_sorted_items_map_from_logs(tracker))
+    batch = placer.run_many(queue)
+
+    # stream: place each order as soon as Phase 1 yields it
+    stream_items: dict = {}
+    sel, placer, _ = build_pipeline(stream_items)
+    stream = placer.run_stream(sel.iter_ranked(run_id="stream"), sorted_items=stream_items)
+
+    print(f"[case 1] {len(stream)} orders, "
+          f"{sum(d is not None for d in stream)} assigned via run_stream")
+    assert summarize(stream) == summarize(batch)
+
+
+class RecordingItems(dict):
+    """sorted_items mapping that logs every read into a shared event list."""
+    def __init__(self, events: list):
+        super().__init__()
+        self.events = events
+
+    def __getitem__(self, order_id):
+        value = super().__getitem__(order_id)
+        self.events.append(("read", order_id, value))
+        return value
+
+
+def case_2_run_stream_publishes_items_first():
+    events: list = []
+    published = RecordingItems(events)
+    sel, placer, _ = build_pipeline(published)
+
+    def pulled(ranked):
+        for oid, items in ranked:
+            events.append(("pull", oid, items))
+            yield oid, items
+
+    placer.run_stream(pulled(sel.iter_ranked(run_id="stream")), sorted_items=published)
+
+    # every read happens after its order was pulled and before the next pull,
+    # and sees exactly the list Phase 1 yielded
+    current = None
+    for kind, oid, items in events:
+        if kind == "pull":
+            current = (oid, items)
+        else:
+            assert current is not None and oid == current[0]
+            assert items is current[1]
+    pulls = [oid for kind, oid, _ in events if kind == "pull"]
+    reads = {oid for kind, oid, _ in events if kind == "read"}
+    print(f"[case 2] {len(pulls)} orders pulled, {len(reads)} read back from sorted_items")
+    assert reads == set(pulls)
+
+
+if __name__ == "__main__":
+    print("=== placer_orchestrator tests ===")
+    case_1_run_stream_matches_run_many()
+    case_2_run_stream_publishes_items_first()
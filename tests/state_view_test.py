@@ -0,0 +1,107 @@
+# tests/state_view_test.py
+"""
+Here’s what each scenario tests:
+
+   Case 1 - closed_trucks per type:
+   Returns only the available trucks of the requested type that are not open,
+   in sorted id order regardless of depot insertion order.
+
+   Case 2 - closed_trucks follows mark_open / mark_close:
+   Opening a truck removes it from the closed list; a departed (mark_close) truck
+   leaves the open set and is not offered as closed again.
+
+   Case 3 - opening a new reefer uses the closed list:
+   maybe_open_new_reefer picks the first closed reefer (by id) that fits.
+"""
+from __future__ import annotations
+
+# --- business objects ---
+from src.business_objects.common import Dimensions, Fragility, SeparationTag, TruckType
+from src.business_objects.item import Item
+from src.business_objects.customer_order import CustomerOrder
+from src.business_objects.truck import Truck
+from src.business_objects.depot import Depot
+
+# --- placers ---
+from src.heuristics.placers.state_view import SimpleStateView
+from src.heuristics.placers.feasibility import SimpleFeasibility
+from src.heuristics.placers.policy import SimplePolicy
+from src.heuristics.placers.best_fit_reefer import maybe_open_new_reefer
+
+
+# ───────────────────────────────── helpers to build a tiny world ───────────────────────────────── #
+
+def reefer(truck_id: str) -> Truck:
+    return Truck(truck_id=truck_id, type=TruckType.REEFER,
+                 total_capacity_m3=24.0, cold_capacity_m3=12.0,
+                 weight_limit_kg=9500, fixed_cost=500, min_utilization=0.60, reserve_fraction=0.06)
+
+
+def dry(truck_id: str) -> Truck:
+    return Truck(truck_id=truck_id, type=TruckType.DRY,
+                 total_capacity_m3=26.0, cold_capacity_m3=0.0,
+                 weight_limit_kg=10000, fixed_cost=460, min_utilization=0.75, reserve_fraction=0.05)
+
+
+def build_state(open_ids: list) -> tuple[SimpleStateView, dict]:
+    # deliberately unsorted insertion order
+    trucks = {t.truck_id: t for t in (reefer("R3"), dry("D2"), reefer("R1"), dry("D1"), reefer("R2"))}
+    items = {
+        "I_MILK": Item(
+            item_id="I_MILK", name="Milk",
+            category_cold=True, unit_weight_kg=1.05, unit_volume_m3=0.0021,
+            dims_m=Dimensions(0.08, 0.08, 0.22),
+            fragility=Fragility.DELICATE, max_stack_load_kg=5,
+            is_liquid=True, upright_only=True, separation_tag=SeparationTag.FOOD,
+        ),
+    }
+    orders = {
+        "O_COLD": CustomerOrder.from_items(
+            order_id="O_COLD", customer_id="C1",
+            item_list={"I_MILK": 100},
+            due_time_str="11:00", items=items,
+        ),
+    }
+    depot = Depot(depot_id="D001", location="TestCity", available_trucks=trucks)
+    state = SimpleStateView(depot=depot, orders=orders, open_truck_ids=open_ids,
+                            sorted_items_provider={}, customers={})
+    return state, trucks
+
+
+# ───────────────────────────────── scenarios ───────────────────────────────── #
+
+def case_1_closed_trucks_sorted_per_type():
+    state, _ = build_state(["R2"])
+    reefers = state.closed_trucks(type_filter="reefer")
+    drys = state.closed_trucks(type_filter="dry")
+    print("[case 1] closed reefers:", reefers, "| closed dry:", drys)
+    assert list(reefers) == ["R1", "R3"]
+    assert list(drys) == ["D1", "D2"]
+
+
+def case_2_closed_trucks_follow_open_and_close():
+    state, _ = build_state([])
+    state.mark_open("R1")
+    assert list(state.closed_trucks(type_filter="reefer")) == ["R2", "R3"]
+    assert "R1" in state.open_trucks(type_filter="reefer")
+
+    state.mark_close("R1")  # departed
+    print("[case 2] after depart R1 → closed:", state.closed_trucks(type_filter="reefer"),
+          "| open:", list(state.open_trucks(type_filter="reefer")))
+    assert "R1" not in state.open_trucks(type_filter="reefer")
+    assert list(state.closed_trucks(type_filter="reefer")) == ["R2", "R3"]
+
+
+def case_3_open_new_reefer_takes_first_closed():
+    state, trucks = build_state(["R1"])
+    trucks["R1"].used_cold_m3 = 12.0  # open reefer is full on cold
+    new_id = maybe_open_new_reefer(state, SimpleFeasibility(), SimplePolicy(), order_id="O_COLD")
+    print("[case 3] maybe_open_new_reefer →", new_id)
+    assert new_id == "R2"
+
+
+if __name__ == "__main__":
+    print("=== state_view tests ===")
+    case_1_closed_trucks_sorted_per_type()
+    case_2_closed_trucks_follow_open_and_close()
+    case_3_open_new_reefer_takes_first_closed()